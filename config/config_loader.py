@@ -5,6 +5,7 @@ This module is responsible for loading and parsing game configuration from YAML
 import os
 import glob
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
@@ -14,6 +15,12 @@ from game.inventory import (
     ItemBase  # Add ItemBase to imports
 )
 
+# Use libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class GameSettings:
@@ -47,6 +54,16 @@ class Location:
     location_items: List[Dict[str, Any]] = field(default_factory=list)
     location_containers: List[Dict[str, Any]] = field(default_factory=list)
 
+    @cached_property
+    def name_lower(self) -> str:
+        """Lower-cased name, for case-insensitive matching."""
+        return self.name.lower()
+
+    @cached_property
+    def id_lower(self) -> str:
+        """Lower-cased ID, for case-insensitive matching."""
+        return self.id.lower()
+
 
 @dataclass
 class NPC:
@@ -60,6 +77,16 @@ class NPC:
     gender: str
     schedule: Dict[str, str] = field(default_factory=dict)
 
+    @cached_property
+    def name_lower(self) -> str:
+        """Lower-cased name, for case-insensitive matching."""
+        return self.name.lower()
+
+    @cached_property
+    def name_parts_lower(self) -> Tuple[str, ...]:
+        """Lower-cased first/last name parts."""
+        return tuple(self.name_lower.split())
+
 
 @dataclass
 class DialogueNode:
@@ -90,7 +117,8 @@ class QuestStage:
 
     def __post_init__(self):
         """Convert status string to QuestStatus enum."""
-        self.status = QuestStatus[self.status]
+        if isinstance(self.status, str):
+            self.status = QuestStatus[self.status]
 
 
 @dataclass
@@ -124,7 +152,8 @@ class Quest:
 
     def __post_init__(self):
         """Convert status string to QuestStatus enum."""
-        self.status = QuestStatus[self.status]
+        if isinstance(self.status, str):
+            self.status = QuestStatus[self.status]
 
 
 @dataclass
@@ -209,7 +238,7 @@ class ConfigLoader:
     def load_config(config_path: str) -> Dict:
         """Load the game configuration from a YAML file."""
         with open(config_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file) or {}  # Return empty dict if file is empty
+            return yaml.load(file, Loader=_YamlLoader) or {}  # Return empty dict if file is empty
 
     def load_single_config(self, config_path: str) -> GameConfig:
         """Load game configuration from a single YAML file."""
@@ -448,6 +477,7 @@ class ConfigLoader:
         print("Parsing Locations")
         locations = {}
         for loc_id, loc_data in config_data.get("locations", {}).items():
+            self.normalize_location_items(loc_data)
             locations[loc_id] = Location(**loc_data)
 
         # Parse NPCs
@@ -510,6 +540,35 @@ class ConfigLoader:
             thoughts=config_data.get("thoughts", {}),
         )
 
+    @staticmethod
+    def parse_categories(names: List[Any], owner_id: str) -> Set[ItemCategory]:
+        """Convert category names to ItemCategory enums, skipping unknown ones."""
+        categories = set()
+        for cat in names:
+            if isinstance(cat, ItemCategory):
+                categories.add(cat)
+                continue
+            try:
+                categories.add(ItemCategory[cat.upper()])
+            except KeyError:
+                print(f"Warning: Unknown item category '{cat}' for item {owner_id}")
+        return categories
+
+    @staticmethod
+    def normalize_location_items(loc_data: Dict) -> None:
+        """
+        Convert category names on a location's inline items, containers and
+        container contents to ItemCategory enums, once at load time.
+        """
+        entries = list(loc_data.get("location_items") or [])
+        for container_data in loc_data.get("location_containers") or []:
+            entries.append(container_data)
+            entries.extend(container_data.get("contents") or [])
+        for entry in entries:
+            for key in ("categories", "allowed_categories"):
+                if key in entry:
+                    entry[key] = ConfigLoader.parse_categories(entry[key], entry.get("id", ""))
+
     @staticmethod
     def create_effect(effect_data: Dict) -> Effect:
         """Create an Effect instance from configuration data."""
@@ -545,13 +604,7 @@ class ConfigLoader:
     def create_item(item_id: str, item_data: Dict) -> ItemBase:
         """Create an appropriate Item instance from configuration data."""
         # Convert category strings to ItemCategory enums
-        categories = set()
-        for cat in item_data.get('categories', []):
-            try:
-                categories.add(ItemCategory[cat.upper()])
-            except KeyError:
-                print(f"Warning: Unknown item category '{cat}' for item {item_id}")
-                continue
+        categories = ConfigLoader.parse_categories(item_data.get('categories', []), item_id)
         
         # Create effects list
         effects = [
@@ -2,19 +2,131 @@
 Core game engine that processes player input and coordinates game systems.
 """
 
+import copy
+import logging
 import random
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from collections import deque
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
-from config.config_loader import GameConfig, ConfigLoader
+from config.config_loader import GameConfig, Location, NPC
 from dialogue.manager import DialogueManager
 from game.game_state import GameState, QuestStatus
-from game.inventory import Container, Item, ItemCategory, Wearable, WearableSlot
+from game.inventory import Container, Item, ItemBase, ItemCategory, Wearable, WearableSlot
 from quest.quest_manager import QuestManager
 from save.save_load import SaveManager
-from ui.dialogue_ui import DialogueMode
 from dialogue.response import DialogueResponse
-from character.character_creator import create_character
+
+logger = logging.getLogger(__name__)
+
+# Verb groups recognised by process_input, built once at import time
+_QUIT_VERBS = frozenset({"quit"})
+_TALK_VERBS = frozenset({"talk", "speak"})
+_GO_VERBS = frozenset({"go", "walk", "move", "head"})
+_TAKE_VERBS = frozenset({"take", "pick", "grab", "get"})
+_DROP_VERBS = frozenset({"drop", "put", "place", "leave"})
+_EXITS_VERBS = frozenset({"exits", "directions", "connections"})
+_QUEST_LOG_VERBS = frozenset({"quests", "journal"})
+_INVENTORY_VERBS = frozenset({"inventory", "inv", "i"})
+_EQUIP_VERBS = frozenset({"equip", "wear", "don"})
+
+# Filler words stripped from NPC names and movement directions
+_TALK_CONNECTING_WORDS = frozenset({"to", "with", "the", "about"})
+_GO_CONNECTING_WORDS = frozenset({"to", "the", "towards", "into", "inside"})
+
+# Pronouns that pick out an NPC by gender
+_PRONOUN_GENDERS = {
+    **dict.fromkeys(("he", "him", "his"), "male"),
+    **dict.fromkeys(("she", "her", "hers"), "female"),
+}
+
+# Most recent notifications kept for display; older ones are dropped
+_MAX_PENDING_NOTIFICATIONS = 64
+
+# Commands that take the rest of the line as their argument
+_SAVE_LOAD_PREFIXES = ("save ", "load ")
+
+_UNKNOWN_COMMAND = "Unknown command. Type 'help' for a list of commands."
+
+# Equipment slots by upper-case name, and the list shown for a bad slot name
+_SLOTS_BY_NAME = WearableSlot.__members__
+_VALID_SLOT_NAMES = ", ".join(_SLOTS_BY_NAME)
+
+# Arrival messages; one is picked at random for each move.
+# Keep exactly four so two random bits index the tuple directly.
+_MOVEMENT_TEMPLATES = (
+    "You make your way to the {name}.\n\n{description}",
+    "You head over to the {name}.\n\n{description}",
+    "You arrive at the {name}.\n\n{description}",
+    "You enter the {name}.\n\n{description}",
+)
+
+# Text shown by the help command
+_HELP_TEXT = "\n".join(
+    [
+        "Available commands:",
+        "  look around - Observe your surroundings",
+        "  examine <item> or look at <item> - Examine an item closely, possibly discovering hidden details",
+        "  talk to <NPC> - Engage in conversation with an NPC",
+        "  go/walk <direction> - Move in the specified direction",
+        "  take/pick up <item> - Pick up an item from the current location",
+        "  take <item> from <container> - Take an item from a container in the location",
+        "  drop <item> - Drop an item at the current location",
+        "  put <item> in <container> - Put an item in a container in the location",
+        "  search - Carefully search the current location for hidden items",
+        "  search <area> - Search a specific area or container for hidden items",
+        "  quests - Open the quest log",
+        "  active quests - List all active quests",
+        "  quest info <id> - Get details about a specific quest",
+        "  quest track <id> - Mark a quest as your current focus",
+        "  save [name] - Save the game with optional name",
+        "  quicksave - Quickly save the game",
+        "  load <name or #> - Load a saved game by name or number from the saves list",
+        "  quickload - Load the most recent quicksave",
+        "  saves - List all saved games",
+        "  inventory/inv/i - View your inventory",
+        "  equip <item> - Equip a wearable item",
+        "  unequip <slot> - Unequip an item from a specific slot",
+        "  use <item> - Use a consumable item",
+        "  open <container> - Open a container to view its contents",
+        "  put <item> in <container> - Place an item in a container",
+        "  take <item> from <container> - Take an item from a container",
+        "  quit/exit - Exit the game",
+        "  help - Display this list of commands",
+    ]
+)
+
+
+def _render_options(response: DialogueResponse.Options) -> str:
+    return "\n".join(["\nOptions:", *(f"- {option.text}" for option in response.options)])
+
+
+def _render_skill_check(response: DialogueResponse.SkillCheck) -> str:
+    result = "Success" if response.success else "Failure"
+    return f"[Skill Check: {response.skill} - {result}]"
+
+
+# Plain-text rendering of dialogue responses when no UI is attached
+_DIALOGUE_RENDERERS = {
+    DialogueResponse.Speech: lambda response: f"{response.speaker}: {response.text}",
+    DialogueResponse.Options: _render_options,
+    DialogueResponse.InnerVoice: lambda response: f"[{response.voice_type}] {response.text}",
+    DialogueResponse.SkillCheck: _render_skill_check,
+}
+
+
+def _clone_item(template: ItemBase) -> ItemBase:
+    """Copy a config item template so in-game changes don't leak into the config."""
+    item = copy.copy(template)
+    if isinstance(item, Container):
+        item.contents = []
+    return item
+
+
+class _ExitsText(NamedTuple):
+    """A location's exits, rendered for the 'exits' command and for look-around."""
+    sentence: str
+    block: str
 
 
 class GameEngine:
@@ -25,11 +137,29 @@ class GameEngine:
     def __init__(self, config: GameConfig):
         """Initialize the game engine with configuration."""
         self.config = config
-        self.current_location = config.game_settings.starting_location
-        self.previous_location = None
         self.game_state = GameState()
-        self.game_state.current_location = self.current_location
         self.game_state.config = config  # Store config in game state for access in other modules
+        # The location setters keep game_state in sync, so game_state must exist first
+        self.current_location = config.game_settings.starting_location
+        self.previous_location = None
+
+        # Index NPCs by location, and by location and gender for pronouns,
+        # once; NPCs don't move during play
+        npcs_by_location: Dict[str, List[NPC]] = {}
+        npcs_by_location_gender: Dict[Tuple[str, str], List[NPC]] = {}
+        for npc in config.npcs.values():
+            npcs_by_location.setdefault(npc.location, []).append(npc)
+            npcs_by_location_gender.setdefault((npc.location, npc.gender), []).append(npc)
+        self._npcs_by_location: Dict[str, Tuple[NPC, ...]] = {
+            location_id: tuple(npcs) for location_id, npcs in npcs_by_location.items()
+        }
+        self._npcs_by_location_gender: Dict[Tuple[str, str], Tuple[NPC, ...]] = {
+            key: tuple(npcs) for key, npcs in npcs_by_location_gender.items()
+        }
+        # Per-location connection data, filled in on first visit
+        # (see _connected_locations and _exits_text)
+        self._connections_cache: Dict[str, Tuple[Location, ...]] = {}
+        self._exits_cache: Dict[str, _ExitsText] = {}
 
         # Initialize quest manager with game state
         self.quest_manager = QuestManager(self.game_state)
@@ -45,67 +175,83 @@ class GameEngine:
         self.dialogue_handler: Optional[DialogueManager] = None
 
         # Notification system
-        self.pending_notifications = []
-        self.notification_timer = time.time()
+        self.pending_notifications: deque[str] = deque(maxlen=_MAX_PENDING_NOTIFICATIONS)
+        self.notification_timer = time.monotonic()
         self.show_notification_indicator = False
 
-        # Start time for playtime tracking
-        self.start_time = time.time()
+        # Start time for playtime tracking (monotonic, so clock changes don't skew playtime)
+        self.start_time = time.monotonic_ns()
         
         # Reference to the UI application, set externally
         self.app = None
         
         # Flag to track if character creation has been completed
         self.character_created = False
+
+        # Single-word commands, looked up before the input is tokenised
+        self._single_word_commands = {
+            **dict.fromkeys(_EXITS_VERBS, self._handle_show_exits),
+            **dict.fromkeys(_QUEST_LOG_VERBS, self._handle_show_quests),
+            **dict.fromkeys(_INVENTORY_VERBS, self._handle_show_inventory),
+            "help": self._help_command,
+            "search": self._handle_search,
+            "quicksave": self._handle_quick_save_command,
+            "quickload": self._handle_quick_load_command,
+            "saves": self._handle_list_saves_command,
+        }
+
+        # Fixed multi-word commands, matched against the leading words of the input
+        self._phrase_commands = {
+            "quick save": self._handle_quick_save_command,
+            "quick load": self._handle_quick_load_command,
+            "list saves": self._handle_list_saves_command,
+            "quest log": self._handle_show_quests,
+            "active quests": self._handle_show_active_quests,
+            "where can i go": self._handle_show_exits,
+        }
+        # Phrase word counts to try, longest first
+        self._phrase_lengths = sorted(
+            {phrase.count(" ") + 1 for phrase in self._phrase_commands}, reverse=True
+        )
+
+        # First-word dispatch for commands that take arguments
+        self._verb_commands = {
+            **dict.fromkeys(_TALK_VERBS, self._dispatch_talk),
+            **dict.fromkeys(_GO_VERBS, self._dispatch_go),
+            **dict.fromkeys(_TAKE_VERBS, self._dispatch_take),
+            **dict.fromkeys(_DROP_VERBS, self._dispatch_drop),
+            **dict.fromkeys(_EQUIP_VERBS, self._dispatch_equip),
+            "look": self._dispatch_look,
+            "examine": self._dispatch_examine,
+            "search": self._dispatch_search,
+            "back": self._dispatch_back,
+            "save": self._dispatch_save,
+            "load": self._dispatch_load,
+            "quest": self._dispatch_quest,
+            "unequip": self._dispatch_unequip,
+            "use": self._dispatch_use,
+            "open": self._dispatch_open,
+        }
+        # Argument-free commands ignore any trailing words
+        for verb, command in self._single_word_commands.items():
+            self._verb_commands.setdefault(verb, lambda parts, command=command: command())
         
         # Load location items from config
         self._load_location_items()
 
     def _load_location_items(self) -> None:
         """Load items from the config into the game state's locations."""
-        print("Loading location items...")
+        logger.debug("Loading location items")
         for location_id, location in self.config.locations.items():
             # Load regular items in the location
             if hasattr(location, 'location_items') and location.location_items:
-                print(f"  Found {len(location.location_items)} items in location {location_id}")
+                logger.debug("Found %d items in location %s", len(location.location_items), location_id)
                 for item_data in location.location_items:
                     # Create a copy of the item to avoid modifying the config
                     # First check if this is a reference to an existing item
                     if 'id' in item_data and item_data['id'] in self.config.items:
                         # Use the existing item as a template
-                        template_item = self.config.items[item_data['id']]
-                        # Create a deep copy of the item
-                        if isinstance(template_item, Container):
-                            item_copy = Container(
-                                id=template_item.id,
-                                name=template_item.name,
-                                description=template_item.description,
-                                categories=template_item.categories,
-                                weight=template_item.weight,
-                                capacity=template_item.capacity,
-                                allowed_categories=template_item.allowed_categories
-                            )
-                        elif isinstance(template_item, Wearable):
-                            item_copy = Wearable(
-                                id=template_item.id,
-                                name=template_item.name,
-                                description=template_item.description,
-                                categories=template_item.categories,
-                                weight=template_item.weight,
-                                slot=template_item.slot,
-                                effects=template_item.effects,
-                                set_id=template_item.set_id
-                            )
-                        else:
-                            item_copy = Item(
-                                id=template_item.id,
-                                name=template_item.name,
-                                description=template_item.description,
-                                categories=template_item.categories,
-                                weight=template_item.weight,
-                                stackable=getattr(template_item, 'stackable', False),
-                                quantity=getattr(template_item, 'quantity', 1)
-                            )
+                        item_copy = _clone_item(self.config.items[item_data['id']])
                         
                         # Add attributes from the location-specific item data that might override defaults
                         if 'is_obvious' in item_data:
@@ -120,17 +266,13 @@ class GameEngine:
                             item_copy.hidden_clues = item_data['hidden_clues']
                             
                     else:
-                        # Create a new item from scratch
-                        categories = []
-                        if 'categories' in item_data:
-                            categories = [ItemCategory[cat] if isinstance(cat, str) else cat 
-                                        for cat in item_data['categories']]
-                                        
+                        # Create a new item from scratch; categories are
+                        # converted to enums when the config is loaded
                         item_copy = Item(
                             id=item_data['id'],
                             name=item_data['name'],
                             description=item_data['description'],
-                            categories=categories,
+                            categories=item_data.get('categories', set()),
                             weight=item_data.get('weight', 0.1),
                             stackable=item_data.get('stackable', False),
                             quantity=item_data.get('quantity', 1)
@@ -168,15 +310,7 @@ class GameEngine:
                     if 'id' in container_data and container_data['id'] in self.config.items:
                         template_container = self.config.items[container_data['id']]
                         if isinstance(template_container, Container):
-                            container = Container(
-                                id=template_container.id,
-                                name=template_container.name,
-                                description=template_container.description,
-                                categories=template_container.categories,
-                                weight=template_container.weight,
-                                capacity=template_container.capacity,
-                                allowed_categories=template_container.allowed_categories
-                            )
+                            container = _clone_item(template_container)
                         else:
                             # Create a new container if the template isn't a Container
                             container = Container(
@@ -190,16 +324,11 @@ class GameEngine:
                             )
                     else:
                         # Create a new container from scratch
-                        categories = []
-                        if 'categories' in container_data:
-                            categories = [ItemCategory[cat] if isinstance(cat, str) else cat 
-                                        for cat in container_data['categories']]
-                                        
                         container = Container(
                             id=container_data['id'],
                             name=container_data['name'],
                             description=container_data['description'],
-                            categories=categories or [ItemCategory.CONTAINER],
+                            categories=container_data.get('categories') or {ItemCategory.CONTAINER},
                             weight=container_data.get('weight', 1.0),
                             capacity=container_data.get('capacity', 10.0),
                             allowed_categories=container_data.get('allowed_categories')
@@ -214,17 +343,8 @@ class GameEngine:
                             if 'id' in content_data and content_data['id'] in self.config.items:
                                 # Use existing item as template
                                 template_item = self.config.items[content_data['id']]
-                                # Create a deep copy
                                 if isinstance(template_item, Item):
-                                    content_item = Item(
-                                        id=template_item.id,
-                                        name=template_item.name,
-                                        description=template_item.description,
-                                        categories=template_item.categories,
-                                        weight=template_item.weight,
-                                        stackable=getattr(template_item, 'stackable', False),
-                                        quantity=getattr(template_item, 'quantity', 1)
-                                    )
+                                    content_item = _clone_item(template_item)
                                 else:
                                     # Create generic item if template isn't an Item
                                     content_item = Item(
@@ -238,16 +358,11 @@ class GameEngine:
                                     )
                             else:
                                 # Create from scratch
-                                categories = []
-                                if 'categories' in content_data:
-                                    categories = [ItemCategory[cat] if isinstance(cat, str) else cat 
-                                                for cat in content_data['categories']]
-                                                
                                 content_item = Item(
                                     id=content_data['id'],
                                     name=content_data['name'],
                                     description=content_data['description'],
-                                    categories=categories,
+                                    categories=content_data.get('categories', set()),
                                     weight=content_data.get('weight', 0.1),
                                     stackable=content_data.get('stackable', False),
                                     quantity=content_data.get('quantity', 1)
@@ -268,23 +383,44 @@ class GameEngine:
         # Set the starting location
         self.navigate_to(self.config.game_settings.starting_location)
             
-        # Give starting inventory items if defined in config
-        if hasattr(self.config.game_settings, 'starting_inventory'):
-            for item_def in self.config.game_settings.starting_inventory:
-                # If item_def is a string, it's directly the item ID
-                if isinstance(item_def, str):
-                    item_id = item_def
-                # Otherwise, it's a dictionary with an 'id' key
-                else:
-                    item_id = item_def.get('id')
-                
-                if item_id and item_id in self.config.items:
-                    self.game_state.add_item(self.config.items[item_id])
+        # Give starting inventory items if defined in config. Entries are either
+        # item IDs or dictionaries with an 'id' key; the player gets copies so
+        # stacking and discoveries don't change the config templates.
+        for item_def in getattr(self.config.game_settings, 'starting_inventory', ()):
+            item_id = item_def if isinstance(item_def, str) else item_def.get('id')
+            template = self.config.items.get(item_id)
+            if template is not None:
+                self.game_state.add_item(_clone_item(template))
 
     def start_character_creation(self) -> None:
         """Start the character creation process."""
+        # Imported here so the engine itself doesn't pull in the Textual UI
+        from character.character_creator import create_character
+
         create_character(self)
 
+    @property
+    def current_location(self) -> str:
+        """ID of the location the player is currently in."""
+        return self._current_location
+
+    @current_location.setter
+    def current_location(self, location_id: str) -> None:
+        self._current_location = location_id
+        self.game_state.current_location = location_id
+        # Resolve the Location once per move instead of in every handler
+        self._current_location_obj = self.config.locations.get(location_id)
+
+    @property
+    def previous_location(self) -> Optional[str]:
+        """ID of the location the player was in before the last move."""
+        return self._previous_location
+
+    @previous_location.setter
+    def previous_location(self, location_id: Optional[str]) -> None:
+        self._previous_location = location_id
+        self.game_state.previous_location = location_id
+
     def current_location_info(self) -> str:
         """Return the current location name."""
         return self.current_location
@@ -294,202 +430,164 @@ class GameEngine:
         # Normalize input: trim and convert to lowercase
         input_text = input_text.strip().lower()
 
-        # Split input into words
-        parts = input_text.split()
+        # Single-word commands don't need the input split into words
+        handler = self._single_word_commands.get(input_text)
+        if handler is None:
+            # Split input into words
+            parts = input_text.split()
 
-        if not parts:
-            return "Please enter a command. Type 'help' for a list of commands."
+            if not parts:
+                return "Please enter a command. Type 'help' for a list of commands."
 
-        # Add quit command handling at the start
-        if parts[0] in ["quit"]:
-            return "__quit__"
+            # Add quit command handling at the start
+            if parts[0] in _QUIT_VERBS:
+                return "__quit__"
 
         # Check for quest updates and get notifications
-        self._check_quest_updates()
-        notifications = self._get_notifications()
-        
-        # Process commands
-        if parts[0] == "look" and len(parts) > 1 and parts[1] == "around":
-            response = self._handle_look_around()
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "examine" and len(parts) > 1:
-            item_name = " ".join(parts[1:])
-            response = self._handle_examine_item(item_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "look" and len(parts) > 2 and parts[1] == "at":
-            item_name = " ".join(parts[2:])
-            response = self._handle_examine_item(item_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "search" and len(parts) > 1:
-            # Handle search <area> command
-            area_name = " ".join(parts[1:])
-            response = self._handle_search_area(area_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "search" and len(parts) == 1:
-            # Handle general search command without specific area
-            response = self._handle_search()
-            return self._format_response(response, notifications)
-
-        elif parts[0] in ["talk", "speak"] and len(parts) > 1:
-            npc_parts = parts[1:]
-            connecting_words = ["to", "with", "the", "about"]
-            npc_name = " ".join(word for word in npc_parts if word.lower() not in connecting_words)
-            if not npc_name:
-                return "Who would you like to talk to?"
-            
-            response = self._handle_talk_to_npc(npc_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] in ["go", "walk", "move", "head"]:
-            direction_parts = parts[1:]
-            connecting_words = ["to", "the", "towards", "into", "inside"]
-            direction = " ".join(word for word in direction_parts if word.lower() not in connecting_words)
-            
-            if not direction:
-                return "Where would you like to go?"
-                
-            response = self._handle_movement(direction)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "back":
-            response = self._handle_movement("back")
-            return self._format_response(response, notifications)
-
-        elif parts[0] in ["take", "pick", "grab", "get"] and len(parts) > 1:
-            # Handle 'pick up' command format
-            if parts[0] == "pick" and len(parts) > 2 and parts[1] == "up":
-                item_name = " ".join(parts[2:])
-            # Handle 'take from container' format
-            elif parts[0] == "take" and len(parts) > 3 and "from" in parts:
-                from_index = parts.index("from")
-                item_name = " ".join(parts[1:from_index])
-                container_name = " ".join(parts[from_index+1:])
-                return self._format_response(self._handle_take_from_location_container(item_name, container_name), notifications)
+        notifications = self._check_quest_updates()
+
+        if handler is not None:
+            response = handler()
+        elif input_text.startswith(_SAVE_LOAD_PREFIXES):
+            # Save/load names are the rest of the (lower-cased) line, with runs
+            # of whitespace collapsed to single spaces
+            command, _, argument = input_text.partition(" ")
+            argument = " ".join(argument.split())
+            if command == "save":
+                response = self._handle_save_command(argument)
             else:
-                item_name = " ".join(parts[1:])
-            
-            response = self._handle_take_item(item_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] in ["drop", "put", "place", "leave"] and len(parts) > 1:
-            # Handle 'put in container' format in location
-            if parts[0] == "put" and len(parts) > 3 and "in" in parts:
-                in_index = parts.index("in")
-                item_name = " ".join(parts[1:in_index])
-                container_name = " ".join(parts[in_index+1:])
-                return self._format_response(self._handle_put_in_location_container(item_name, container_name), notifications)
-            else:
-                item_name = " ".join(parts[1:])
-                
-            response = self._handle_drop_item(item_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] in ["exits", "directions", "connections"] or (
-            len(parts) >= 3
-            and parts[0] == "where"
-            and parts[1] == "can"
-            and parts[2] == "i"
-            and parts[3] == "go"
-        ):
-            response = self._handle_show_exits()
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "save":
-            save_name = " ".join(parts[1:]) if len(parts) > 1 else ""
-            response = self._handle_save_command(save_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "quicksave" or (
-            len(parts) == 2 and parts[0] == "quick" and parts[1] == "save"
-        ):
-            response = self._handle_quick_save_command()
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "load" and len(parts) > 1:
-            load_identifier = " ".join(parts[1:])
-            response = self._handle_load_command(load_identifier)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "quickload" or (
-            len(parts) == 2 and parts[0] == "quick" and parts[1] == "load"
-        ):
-            response = self._handle_quick_load_command()
-            return self._format_response(response, notifications)
+                response = self._handle_load_command(argument)
+        elif len(parts) > 1 and (handler := self._match_phrase(parts)):
+            response = handler()
+        elif handler := self._verb_commands.get(parts[0]):
+            # Everything else dispatches on the first word
+            response = handler(parts)
+        else:
+            response = _UNKNOWN_COMMAND
 
-        elif parts[0] == "saves" or (
-            len(parts) == 2 and parts[0] == "list" and parts[1] == "saves"
-        ):
-            response = self._handle_list_saves_command()
-            return self._format_response(response, notifications)
+        # Most commands raise no notifications, so skip formatting for them
+        if not notifications:
+            return response
+        return self._format_response(response, notifications)
+
+    def _match_phrase(self, parts: List[str]) -> Optional[Callable[[], str]]:
+        """Return the handler for a fixed phrase the input starts with, if any."""
+        for length in self._phrase_lengths:
+            if len(parts) >= length:
+                handler = self._phrase_commands.get(" ".join(parts[:length]))
+                if handler is not None:
+                    return handler
+        return None
 
-        elif parts[0] in ["quests", "journal"] or (
-            len(parts) == 2 and parts[0] == "quest" and parts[1] == "log"
-        ):
-            response = self._handle_show_quests()
-            return self._format_response(response, notifications)
-
-        # Inventory commands
-        elif parts[0] in ["inventory", "inv", "i"]:
-            response = self._handle_show_inventory()
-            return self._format_response(response, notifications)
-
-        elif parts[0] in ["equip", "wear", "put on", "don"] and len(parts) > 1:
-            item_name = " ".join(parts[1:])
-            response = self._handle_equip_item(item_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "unequip" and len(parts) > 1:
-            slot_name = " ".join(parts[1:])
-            response = self._handle_unequip_item(slot_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "use" and len(parts) > 1:
-            item_name = " ".join(parts[1:])
-            response = self._handle_use_item(item_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "open" and len(parts) > 1:
-            container_name = " ".join(parts[1:])
-            response = self._handle_open_container(container_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "put" and len(parts) > 3 and parts[2] == "in":
-            item_name = parts[1]
-            container_name = " ".join(parts[3:])
-            response = self._handle_put_in_container(item_name, container_name)
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "take" and len(parts) > 3 and parts[2] == "from":
-            item_name = parts[1]
-            container_name = " ".join(parts[3:])
-            response = self._handle_take_from_container(item_name, container_name)
-            return self._format_response(response, notifications)
-
-        elif len(parts) == 3 and parts[0] == "quest" and parts[1] == "track":
-            quest_id = parts[2]
-            response = self._handle_track_quest(quest_id)
-            return self._format_response(response, notifications)
-
-        elif len(parts) == 3 and parts[0] == "quest" and parts[1] == "info":
-            quest_id = parts[2]
-            response = self._handle_quest_info(quest_id)
-            return self._format_response(response, notifications)
-
-        elif len(parts) == 2 and parts[0] == "active" and parts[1] == "quests":
-            response = self._handle_show_active_quests()
-            return self._format_response(response, notifications)
-
-        elif parts[0] == "help":
-            response = self._help_command()
-            return self._format_response(response, notifications)
+    def _dispatch_look(self, parts: List[str]) -> str:
+        """Handle 'look around' and 'look at <item>'."""
+        if len(parts) > 1 and parts[1] == "around":
+            return self._handle_look_around()
+        if len(parts) > 2 and parts[1] == "at":
+            return self._handle_examine_item(" ".join(parts[2:]))
+        return _UNKNOWN_COMMAND
+
+    def _dispatch_examine(self, parts: List[str]) -> str:
+        """Handle 'examine <item>'."""
+        if len(parts) > 1:
+            return self._handle_examine_item(" ".join(parts[1:]))
+        return _UNKNOWN_COMMAND
+
+    def _dispatch_search(self, parts: List[str]) -> str:
+        """Handle 'search' with or without a specific area."""
+        if len(parts) > 1:
+            return self._handle_search_area(" ".join(parts[1:]))
+        return self._handle_search()
+
+    def _dispatch_talk(self, parts: List[str]) -> str:
+        """Handle 'talk to <npc>' and its synonyms."""
+        if len(parts) == 1:
+            return _UNKNOWN_COMMAND
+        npc_name = " ".join(word for word in parts[1:] if word not in _TALK_CONNECTING_WORDS)
+        if not npc_name:
+            return "Who would you like to talk to?"
+        return self._handle_talk_to_npc(npc_name)
 
-        else:
-            response = "Unknown command. Type 'help' for a list of commands."
-            return self._format_response(response, notifications)
+    def _dispatch_go(self, parts: List[str]) -> str:
+        """Handle 'go to <location>' and its synonyms."""
+        direction = " ".join(word for word in parts[1:] if word not in _GO_CONNECTING_WORDS)
+        if not direction:
+            return "Where would you like to go?"
+        return self._handle_movement(direction)
+
+    def _dispatch_back(self, parts: List[str]) -> str:
+        """Handle 'back' to return to the previous location."""
+        return self._handle_movement("back")
+
+    def _dispatch_take(self, parts: List[str]) -> str:
+        """Handle 'take <item>', 'pick up <item>' and 'take <item> from <container>'."""
+        if len(parts) == 1:
+            return _UNKNOWN_COMMAND
+        # Handle 'pick up' command format
+        if parts[0] == "pick" and len(parts) > 2 and parts[1] == "up":
+            return self._handle_take_item(" ".join(parts[2:]))
+        # Handle 'take from container' format
+        if parts[0] == "take" and len(parts) > 3 and "from" in parts:
+            from_index = parts.index("from")
+            item_name = " ".join(parts[1:from_index])
+            container_name = " ".join(parts[from_index+1:])
+            return self._handle_take_from_location_container(item_name, container_name)
+        return self._handle_take_item(" ".join(parts[1:]))
+
+    def _dispatch_drop(self, parts: List[str]) -> str:
+        """Handle 'drop <item>' and 'put <item> in <container>'."""
+        if len(parts) == 1:
+            return _UNKNOWN_COMMAND
+        # Handle 'put in container' format in location
+        if parts[0] == "put" and len(parts) > 3 and "in" in parts:
+            in_index = parts.index("in")
+            item_name = " ".join(parts[1:in_index])
+            container_name = " ".join(parts[in_index+1:])
+            return self._handle_put_in_location_container(item_name, container_name)
+        return self._handle_drop_item(" ".join(parts[1:]))
+
+    def _dispatch_save(self, parts: List[str]) -> str:
+        """Handle 'save' with an optional save name."""
+        return self._handle_save_command(" ".join(parts[1:]))
+
+    def _dispatch_load(self, parts: List[str]) -> str:
+        """Handle 'load <save name>'."""
+        if len(parts) > 1:
+            return self._handle_load_command(" ".join(parts[1:]))
+        return _UNKNOWN_COMMAND
+
+    def _dispatch_quest(self, parts: List[str]) -> str:
+        """Handle 'quest track <id>' and 'quest info <id>'."""
+        if len(parts) == 3:
+            if parts[1] == "track":
+                return self._handle_track_quest(parts[2])
+            if parts[1] == "info":
+                return self._handle_quest_info(parts[2])
+        return _UNKNOWN_COMMAND
+
+    def _dispatch_equip(self, parts: List[str]) -> str:
+        """Handle 'equip <item>' and its synonyms."""
+        if len(parts) > 1:
+            return self._handle_equip_item(" ".join(parts[1:]))
+        return _UNKNOWN_COMMAND
+
+    def _dispatch_unequip(self, parts: List[str]) -> str:
+        """Handle 'unequip <slot or item>'."""
+        if len(parts) > 1:
+            return self._handle_unequip_item(" ".join(parts[1:]))
+        return _UNKNOWN_COMMAND
+
+    def _dispatch_use(self, parts: List[str]) -> str:
+        """Handle 'use <item>'."""
+        if len(parts) > 1:
+            return self._handle_use_item(" ".join(parts[1:]))
+        return _UNKNOWN_COMMAND
+
+    def _dispatch_open(self, parts: List[str]) -> str:
+        """Handle 'open <container>'."""
+        if len(parts) > 1:
+            return self._handle_open_container(" ".join(parts[1:]))
+        return _UNKNOWN_COMMAND
 
     def _format_response(self, response: str, notifications: List[str]) -> str:
         """Format the response with any pending notifications."""
@@ -498,29 +596,21 @@ class GameEngine:
             return f"{notification_text}\n\n{response}"
         return response
 
-    def _get_notifications(self) -> List[str]:
-        """Get and clear any pending notifications."""
-        notifications = self.quest_manager.get_active_notifications()
-        self.quest_manager.clear_old_notifications(0)  # Clear all notifications
-        return [notification.message for notification in notifications]
-
-    def _check_quest_updates(self) -> None:
-        """Check for quest updates and process them."""
+    def _check_quest_updates(self) -> List[str]:
+        """Check for quest updates and return the messages of any new notifications."""
         self.quest_manager.check_all_quest_updates()
 
-        # Check for new notifications
-        notifications = self.quest_manager.get_active_notifications()
+        # Take the notifications raised since the last command
+        notifications = self.quest_manager.drain_notifications()
         if notifications:
             # Set notification indicator
             self.show_notification_indicator = True
 
             # Add newest notification to pending display
-            if notifications and notifications[0].is_new:
-                self.pending_notifications.append(notifications[0].message)
-                self.notification_timer = time.time()
+            self.pending_notifications.append(notifications[0].message)
+            self.notification_timer = time.monotonic()
 
-            # Reset notification age timer
-            self.quest_manager.clear_old_notifications(300)  # 5 minutes
+        return [notification.message for notification in notifications]
 
     def start_quest(self, quest_id: str) -> bool:
         """Start a quest by ID."""
@@ -532,53 +622,44 @@ class GameEngine:
 
     def get_playtime(self) -> int:
         """Get total playtime in seconds."""
-        return int(time.time() - self.start_time)
+        return (time.monotonic_ns() - self.start_time) // 1_000_000_000
 
     def _handle_look_around(self) -> str:
         """Handle the 'look around' command."""
-        location = self.config.locations.get(self.current_location)
+        location = self._current_location_obj
         if not location:
             return "You look around but see nothing of interest."
 
-        response = location.description
+        parts = [location.description]
 
         # Find NPCs in the current location
-        npcs_here = [
-            npc
-            for npc in self.config.npcs.values()
-            if npc.location == self.current_location
-        ]
+        npcs_here = self._npcs_here()
 
         if npcs_here:
-            response += "\n\nYou see:"
-            for npc in npcs_here:
-                response += f"\n- {npc.name}"
+            parts.append("\n\nYou see:")
+            parts.extend(f"\n- {npc.name}" for npc in npcs_here)
 
         # Add obvious items in the location
         obvious_items = self.game_state.get_obvious_items(self.current_location)
         if obvious_items:
             if not npcs_here:  # Only add the "You see:" header if we didn't already add it for NPCs
-                response += "\n\nYou see:"
+                parts.append("\n\nYou see:")
             for item in obvious_items:
                 if item.quantity > 1:
-                    response += f"\n- {item.name} (x{item.quantity})"
+                    parts.append(f"\n- {item.name} (x{item.quantity})")
                 else:
-                    response += f"\n- {item.name}"
+                    parts.append(f"\n- {item.name}")
 
         # Add connected locations
-        if location.connected_locations:
-            response += "\n\nFrom here, you can see:"
-            for loc_id in location.connected_locations:
-                if connected_loc := self.config.locations.get(loc_id):
-                    response += f"\n- The {connected_loc.name}"
+        parts.append(self._exits_text(location).block)
 
-        return response
+        return "".join(parts)
 
     def _handle_movement(self, direction: str) -> str:
         """Handle movement commands."""
         if not direction:
             return "You need to specify a direction to move."
-        current_location = self.config.locations.get(self.current_location)
+        current_location = self._current_location_obj
         if not current_location:
             return "ERROR: Current location not found."
 
@@ -591,16 +672,15 @@ class GameEngine:
 
         # Try to match direction with a connected location
         else:
-            target_location_id = self._find_closest_location_match(
-                direction, current_location.connected_locations
+            target_location_id = self._match_location(
+                direction, self._connected_locations(current_location)
             )
-            print(f"Target location ID: {target_location_id}")
+            logger.debug("Target location ID: %s", target_location_id)
 
             if not target_location_id:
                 valid_exits = [
-                    self.config.locations[loc_id].name
-                    for loc_id in current_location.connected_locations
-                    if loc_id in self.config.locations
+                    connected_loc.name
+                    for connected_loc in self._connected_locations(current_location)
                 ]
                 if valid_exits:
                     return f"You can't go to the {direction} from here. Valid exits are: {', '.join(valid_exits)}."
@@ -616,61 +696,79 @@ class GameEngine:
         self.current_location = target_location_id
         return self._get_movement_response(new_location.name, new_location.description)
 
-    def _find_closest_location_match(self, partial: str, connected_locations: List[str]) -> Optional[str]:
-        """Find the closest matching location ID or name."""
-        matches = []
-        for loc_id in connected_locations:
-            connected_loc = self.config.locations.get(loc_id)
-            if not connected_loc:
-                continue
-
-            # Match by partial name or ID
-            if (
-                partial.lower() in connected_loc.name.lower()
-                or partial.lower() in loc_id.lower()
-            ):
-                matches.append(loc_id)
+    def _match_location(self, partial: str, candidates: Sequence[Location]) -> Optional[str]:
+        """Match a lower-case partial name or ID against already-resolved locations."""
+        # Match by partial name or ID
+        matches = [
+            connected_loc
+            for connected_loc in candidates
+            if partial in connected_loc.name_lower or partial in connected_loc.id_lower
+        ]
 
         if len(matches) > 1:
-            matching_names = [self.config.locations[loc_id].name for loc_id in matches]
+            matching_names = [connected_loc.name for connected_loc in matches]
             raise ValueError(
                 f"Ambiguous direction: multiple locations match '{partial}'. Matches: {', '.join(matching_names)}. Please be more specific."
             )
         elif len(matches) == 1:
-            return matches[0]
+            return matches[0].id
         return None
 
     def _handle_show_exits(self) -> str:
         """Handle the 'exits' command."""
-        current_location = self.config.locations.get(self.current_location)
+        current_location = self._current_location_obj
         if not current_location:
             return "ERROR: Current location not found."
 
-        if not current_location.connected_locations:
-            return "There are no obvious exits from here."
+        return self._exits_text(current_location).sentence
+
+    def _connected_locations(self, location: Location) -> Tuple[Location, ...]:
+        """Return the Location objects connected to a location, skipping unknown IDs."""
+        connected = self._connections_cache.get(location.id)
+        if connected is None:
+            connected = self._connections_cache[location.id] = tuple(
+                connected_loc
+                for loc_id in location.connected_locations
+                if (connected_loc := self.config.locations.get(loc_id))
+            )
+        return connected
+
+    def _exits_text(self, location: Location) -> _ExitsText:
+        """
+        Return the exits sentence and the look-around exits block for a location.
+        Connections are static config data, so both are built once per location.
+        """
+        cached = self._exits_cache.get(location.id)
+        if cached is not None:
+            return cached
 
         # Collect names of connected locations
-        location_names = []
-        for loc_id in current_location.connected_locations:
-            if connected_loc := self.config.locations.get(loc_id):
-                location_names.append(connected_loc.name)
+        location_names = [
+            connected_loc.name for connected_loc in self._connected_locations(location)
+        ]
 
         # Format list naturally
         if not location_names:
-            return "There are no obvious exits from here."
+            sentence = "There are no obvious exits from here."
+        elif len(location_names) == 1:
+            sentence = f"From here, you can go to the {location_names[0]}."
+        else:
+            sentence = (
+                f"From here, you can go to the {', the '.join(location_names[:-1])}"
+                f" or the {location_names[-1]}."
+            )
 
-        if len(location_names) == 1:
-            return f"From here, you can go to the {location_names[0]}."
+        block = ""
+        if location.connected_locations:
+            block = "\n\nFrom here, you can see:" + "".join(
+                f"\n- The {name}" for name in location_names
+            )
 
-        last = location_names.pop()
-        return f"From here, you can go to the {', the '.join(location_names)} or the {last}."
+        cached = self._exits_cache[location.id] = _ExitsText(sentence, block)
+        return cached
 
     def _handle_save_command(self, save_name: str) -> str:
         """Handle the 'save' command."""
-        # Update game state with current location before saving
-        self.game_state.current_location = self.current_location
-        self.game_state.previous_location = self.previous_location
-
         # Use provided name or "Unnamed Save"
         name = save_name if save_name else "Unnamed Save"
 
@@ -682,10 +780,6 @@ class GameEngine:
 
     def _handle_quick_save_command(self) -> str:
         """Handle the 'quicksave' command."""
-        # Update game state with current location before saving
-        self.game_state.current_location = self.current_location
-        self.game_state.previous_location = self.previous_location
-
         try:
             self.save_manager.quick_save(self.game_state, self.get_playtime())
             return "Game quick-saved."
@@ -748,75 +842,70 @@ class GameEngine:
             if not saves:
                 return "No saved games found."
 
-            response = "Saved games:\n"
-
-            for i, save in enumerate(saves, 1):
-                playtime = self.save_manager.format_playtime(save.playtime)
-                response += f"{i}. {save.save_name} - {save.timestamp:%Y-%m-%d %H:%M} - {save.current_location} - {playtime}\n"
-
-            response += "\nTo load a game, type 'load <save name>'"
-            return response
+            format_playtime = self.save_manager.format_playtime
+            lines = [
+                f"{i}. {save.save_name} - {save.timestamp:%Y-%m-%d %H:%M} - {save.current_location} - {format_playtime(save.playtime)}\n"
+                for i, save in enumerate(saves, 1)
+            ]
+            return f"Saved games:\n{''.join(lines)}\nTo load a game, type 'load <save name>'"
 
         except Exception as e:
             return f"Failed to list saves: {e}"
 
     def _handle_show_quests(self) -> str:
         """Handle the quest log command."""
-        active_quests = self.quest_manager.game_state.get_active_quests()
-        completed_quests = self.quest_manager.game_state.get_completed_quests()
-        failed_quests = self.quest_manager.game_state.get_failed_quests()
+        quests_by_status = self.game_state.get_quests_by_status()
+        active_quests = quests_by_status[QuestStatus.InProgress]
+        completed_quests = quests_by_status[QuestStatus.Completed]
+        failed_quests = quests_by_status[QuestStatus.Failed]
 
-        response = "Quest Log:\n"
+        parts = ["Quest Log:\n"]
 
         if active_quests:
-            response += "Active Quests:\n"
+            parts.append("Active Quests:\n")
             for quest in active_quests:
-                response += f"- {quest.title}: {quest.description}\n"
-                # Get active stage ID using game_state method
-                active_stage_id = self.game_state.get_active_stage(quest.id)
-                if active_stage_id:
-                    # Find the stage with the active stage ID
-                    current_stage = next((stage for stage in quest.stages 
-                                        if stage.id == active_stage_id), None)
-                    if current_stage:
-                        response += f"  Current Stage: {current_stage.title}\n"
-                        response += f"  {current_stage.description}\n"
-                        
-                        # Show objectives with completion status
-                        incomplete_objectives = []
-                        for obj in current_stage.objectives:
-                            is_completed = self.quest_manager.is_objective_completed(quest.id, obj.get('id', ''))
-                            status = "✓" if is_completed else "○"
-                            optional = "(Optional) " if obj.get("is_optional", False) else ""
-                            response += f"  {status} {optional}{obj.get('description', '')}\n"
-                            
-                            # Track incomplete objectives for next steps
-                            if not is_completed and not obj.get("is_optional", False):
-                                incomplete_objectives.append(obj)
+                parts.append(f"- {quest.title}: {quest.description}\n")
+                # Get the active stage tracked by the quest state
+                current_stage = self.game_state.get_current_stage(quest.id)
+                if current_stage:
+                    parts.append(f"  Current Stage: {current_stage.title}\n")
+                    parts.append(f"  {current_stage.description}\n")
+                    
+                    # Show objectives with completion status
+                    incomplete_objectives = []
+                    for obj in current_stage.objectives:
+                        is_completed = self.quest_manager.is_objective_completed(quest.id, obj.get('id', ''))
+                        status = "✓" if is_completed else "○"
+                        optional = "(Optional) " if obj.get("is_optional", False) else ""
+                        parts.append(f"  {status} {optional}{obj.get('description', '')}\n")
                         
-                        # Show next objective(s)
-                        if incomplete_objectives:
-                            response += "  Next Steps:\n"
-                            for obj in incomplete_objectives[:2]:  # Show up to 2 next objectives
-                                response += f"  → {obj.get('description', '')}\n"
-                response += "\n"
+                        # Track incomplete objectives for next steps
+                        if not is_completed and not obj.get("is_optional", False):
+                            incomplete_objectives.append(obj)
+                    
+                    # Show next objective(s)
+                    if incomplete_objectives:
+                        parts.append("  Next Steps:\n")
+                        for obj in incomplete_objectives[:2]:  # Show up to 2 next objectives
+                            parts.append(f"  → {obj.get('description', '')}\n")
+                parts.append("\n")
 
         if completed_quests:
-            response += "Completed Quests:\n"
+            parts.append("Completed Quests:\n")
             for quest in completed_quests:
-                response += f"- {quest.title}: {quest.description[:50]}...\n"
-            response += "\n"
+                parts.append(f"- {quest.title}: {quest.description[:50]}...\n")
+            parts.append("\n")
 
         if failed_quests:
-            response += "Failed Quests:\n"
+            parts.append("Failed Quests:\n")
             for quest in failed_quests:
-                response += f"- {quest.title}: {quest.description[:50]}...\n"
-            response += "\n"
+                parts.append(f"- {quest.title}: {quest.description[:50]}...\n")
+            parts.append("\n")
 
         if not active_quests and not completed_quests and not failed_quests:
-            response += "No quests available.\n"
+            parts.append("No quests available.\n")
 
-        return response
+        return "".join(parts)
 
     def _handle_track_quest(self, quest_id: str) -> str:
         """Handle tracking a specific quest."""
@@ -824,31 +913,27 @@ class GameEngine:
         if not quest:
             return f"Quest '{quest_id}' not found."
 
-        if quest_id not in self.game_state.quest_log:
+        if not self.quest_manager.is_quest_active(quest_id):
             return f"Quest '{quest.title}' is not active."
 
-        # Get active stage ID using game_state method
-        active_stage_id = self.game_state.get_active_stage(quest_id)
-        if not active_stage_id:
-            return f"Quest '{quest.title}' has no active stage."
-            
-        # Find the stage with the active stage ID
-        current_stage = next((stage for stage in quest.stages 
-                            if stage.id == active_stage_id), None)
+        # Get the active stage tracked by the quest state
+        current_stage = self.game_state.get_current_stage(quest_id)
         if not current_stage:
             return f"Quest '{quest.title}' has no active stage."
 
-        response = f"Tracking Quest: {quest.title}\n"
-        response += f"Current Stage: {current_stage.title}\n"
-        response += f"{current_stage.description}\n\n"
-        response += "Objectives:\n"
+        parts = [
+            f"Tracking Quest: {quest.title}\n",
+            f"Current Stage: {current_stage.title}\n",
+            f"{current_stage.description}\n\n",
+            "Objectives:\n",
+        ]
         for obj in current_stage.objectives:
             is_completed = self.quest_manager.is_objective_completed(quest_id, obj.get('id', ''))
             status = "✓" if is_completed else "○"
             optional = "(Optional) " if obj.get("is_optional", False) else ""
-            response += f"{status} {optional}{obj.get('description', '')}\n"
+            parts.append(f"{status} {optional}{obj.get('description', '')}\n")
 
-        return response
+        return "".join(parts)
 
     def _handle_quest_info(self, quest_id: str) -> str:
         """Handle showing detailed information about a quest."""
@@ -856,32 +941,32 @@ class GameEngine:
         if not quest:
             return f"Quest '{quest_id}' not found."
 
-        response = f"Quest: {quest.title}\n"
-        response += f"Type: {'Main Quest' if quest.is_main_quest else 'Side Quest'}\n"
-        response += f"Status: {self.game_state.get_quest_status(quest_id).name}\n\n"
-        response += f"Description:\n{quest.description}\n\n"
+        parts = [
+            f"Quest: {quest.title}\n",
+            f"Type: {'Main Quest' if quest.is_main_quest else 'Side Quest'}\n",
+            f"Status: {self.game_state.get_quest_status(quest_id).name}\n\n",
+            f"Description:\n{quest.description}\n\n",
+        ]
 
         if quest.stages:
-            response += "Stages:\n"
+            parts.append("Stages:\n")
+            current_stage = self.game_state.get_current_stage(quest_id)
             for stage in quest.stages:
                 # Get a marker to show the current active stage
-                active_marker = ""
-                active_stage_id = self.game_state.get_active_stage(quest_id)
-                if active_stage_id and stage.id == active_stage_id:
-                    active_marker = " [CURRENT]"
+                active_marker = " [CURRENT]" if stage is current_stage else ""
                     
-                response += f"- {stage.title}{active_marker}\n"
-                response += f"  {stage.description}\n"
+                parts.append(f"- {stage.title}{active_marker}\n")
+                parts.append(f"  {stage.description}\n")
                 if stage.objectives:
-                    response += "  Objectives:\n"
+                    parts.append("  Objectives:\n")
                     for obj in stage.objectives:
                         is_completed = self.game_state.is_objective_completed(quest_id, obj.get('id', ''))
                         status = "✓" if is_completed else "○"
                         optional = "(Optional) " if obj.get("is_optional", False) else ""
-                        response += f"  {status} {optional}{obj.get('description', '')}\n"
-                response += "\n"
+                        parts.append(f"  {status} {optional}{obj.get('description', '')}\n")
+                parts.append("\n")
 
-        return response
+        return "".join(parts)
 
     def _handle_show_active_quests(self) -> str:
         """Handle showing only active quests."""
@@ -889,98 +974,52 @@ class GameEngine:
         if not active_quests:
             return "No active quests."
 
-        response = "Active Quests:\n\n"
+        parts = ["Active Quests:\n\n"]
         for quest in active_quests:
-            response += f"- {quest.title}\n"
-            # Get active stage ID using game_state method
-            active_stage_id = self.game_state.get_active_stage(quest.id)
-            if active_stage_id:
-                # Find the stage with the active stage ID
-                current_stage = next((stage for stage in quest.stages 
-                                    if stage.id == active_stage_id), None)
-                if current_stage:
-                    response += f"  Current Stage: {current_stage.title}\n"
-                    response += f"  {current_stage.description}\n"
-                    for obj in current_stage.objectives:
-                        is_completed = self.quest_manager.is_objective_completed(quest.id, obj.get('id', ''))
-                        status = "✓" if is_completed else "○"
-                        optional = "(Optional) " if obj.get("is_optional", False) else ""
-                        response += f"  {status} {optional}{obj.get('description', '')}\n"
-            response += "\n"
-
-        return response
+            parts.append(f"- {quest.title}\n")
+            # Get the active stage tracked by the quest state
+            current_stage = self.game_state.get_current_stage(quest.id)
+            if current_stage:
+                parts.append(f"  Current Stage: {current_stage.title}\n")
+                parts.append(f"  {current_stage.description}\n")
+                for obj in current_stage.objectives:
+                    is_completed = self.quest_manager.is_objective_completed(quest.id, obj.get('id', ''))
+                    status = "✓" if is_completed else "○"
+                    optional = "(Optional) " if obj.get("is_optional", False) else ""
+                    parts.append(f"  {status} {optional}{obj.get('description', '')}\n")
+            parts.append("\n")
+
+        return "".join(parts)
 
     def _get_movement_response(self, location_name: str, description: str) -> str:
         """Get a randomized response for moving to a new location."""
-        responses = [
-            f"You make your way to the {location_name}.\n\n{description}",
-            f"You head over to the {location_name}.\n\n{description}",
-            f"You arrive at the {location_name}.\n\n{description}",
-            f"You enter the {location_name}.\n\n{description}",
-        ]
-
-        return random.choice(responses)
+        template = _MOVEMENT_TEMPLATES[random.getrandbits(2)]
+        return template.format(name=location_name, description=description)
 
     def _help_command(self) -> str:
         """Display help information."""
-        return "\n".join(
-            [
-                "Available commands:",
-                "  look around - Observe your surroundings",
-                "  examine <item> or look at <item> - Examine an item closely, possibly discovering hidden details",
-                "  talk to <NPC> - Engage in conversation with an NPC",
-                "  go/walk <direction> - Move in the specified direction",
-                "  take/pick up <item> - Pick up an item from the current location",
-                "  take <item> from <container> - Take an item from a container in the location",
-                "  drop <item> - Drop an item at the current location",
-                "  put <item> in <container> - Put an item in a container in the location",
-                "  search - Carefully search the current location for hidden items",
-                "  search <area> - Search a specific area or container for hidden items",
-                "  quests - Open the quest log",
-                "  active quests - List all active quests",
-                "  quest info <id> - Get details about a specific quest",
-                "  quest track <id> - Mark a quest as your current focus",
-                "  save [name] - Save the game with optional name",
-                "  quicksave - Quickly save the game",
-                "  load <name or #> - Load a saved game by name or number from the saves list",
-                "  quickload - Load the most recent quicksave",
-                "  saves - List all saved games",
-                "  inventory/inv/i - View your inventory",
-                "  equip <item> - Equip a wearable item",
-                "  unequip <slot> - Unequip an item from a specific slot",
-                "  use <item> - Use a consumable item",
-                "  open <container> - Open a container to view its contents",
-                "  put <item> in <container> - Place an item in a container",
-                "  take <item> from <container> - Take an item from a container",
-                "  quit/exit - Exit the game",
-                "  help - Display this list of commands",
-            ]
-        )
+        return _HELP_TEXT
+
+    def _npcs_here(self) -> Tuple[NPC, ...]:
+        """Return the NPCs in the current location."""
+        return self._npcs_by_location.get(self.current_location, ())
 
     def _find_matching_npc(self, npc_descriptor: str) -> tuple[Optional[str], list[str]]:
         """
         Find matching NPC(s) based on a descriptor (name, role, or pronoun).
+        The descriptor must already be lower-case, as passed on from process_input.
         Returns tuple of (matched_npc_id, list_of_ambiguous_npcs).
         """
         # Get NPCs in current location
-        npcs_here = [
-            npc for npc in self.config.npcs.values()
-            if npc.location == self.current_location
-        ]
+        npcs_here = self._npcs_here()
         
         if not npcs_here:
             return None, []
 
         # Check for pronoun matches (using gender field)
-        npc_descriptor = npc_descriptor.lower()
-        if npc_descriptor in ['he', 'him', 'his']:
-            matching_npcs = [npc for npc in npcs_here if npc.gender == 'male']
-            if len(matching_npcs) == 1:
-                return matching_npcs[0].id, []
-            elif len(matching_npcs) > 1:
-                return None, [npc.name for npc in matching_npcs]
-        elif npc_descriptor in ['she', 'her', 'hers']:
-            matching_npcs = [npc for npc in npcs_here if npc.gender == 'female']
+        gender = _PRONOUN_GENDERS.get(npc_descriptor)
+        if gender is not None:
+            matching_npcs = self._npcs_by_location_gender.get((self.current_location, gender), ())
             if len(matching_npcs) == 1:
                 return matching_npcs[0].id, []
             elif len(matching_npcs) > 1:
@@ -990,14 +1029,12 @@ class GameEngine:
         matching_npcs = []
         for npc in npcs_here:
             # Check full name match (case insensitive)
-            if npc_descriptor in npc.name.lower():
+            if npc_descriptor in npc.name_lower:
                 matching_npcs.append(npc)
                 continue
             
             # Check first/last name matches for NPCs with multiple name parts
-            name_parts = npc.name.lower().split()
-            matches = [part for part in name_parts if npc_descriptor in part]
-            if len(matches) > 0:
+            if any(npc_descriptor in part for part in npc.name_parts_lower):
                 matching_npcs.append(npc)
                 continue
 
@@ -1023,10 +1060,7 @@ class GameEngine:
         # Handle no matches
         if not matched_npc_id:
             # Get list of NPCs in current location for helpful message
-            npcs_here = [
-                npc.name for npc in self.config.npcs.values()
-                if npc.location == self.current_location
-            ]
+            npcs_here = [npc.name for npc in self._npcs_here()]
             if npcs_here:
                 return f"I don't see anyone like that here. You can talk to: {', '.join(npcs_here)}."
             return "There's no one here to talk to."
@@ -1048,18 +1082,10 @@ class GameEngine:
                 # Fallback to text-based display if UI is not available
                 dialogue_text = []
                 for response in responses:
-                    if isinstance(response, DialogueResponse.Speech):
-                        dialogue_text.append(f"{response.speaker}: {response.text}")
-                    elif isinstance(response, DialogueResponse.Options):
-                        dialogue_text.append("\nOptions:")
-                        for option in response.options:
-                            dialogue_text.append(f"- {option.text}")
-                    elif isinstance(response, DialogueResponse.InnerVoice):
-                        dialogue_text.append(f"[{response.voice_type}] {response.text}")
-                    elif isinstance(response, DialogueResponse.SkillCheck):
-                        result = "Success" if response.success else "Failure"
-                        dialogue_text.append(f"[Skill Check: {response.skill} - {result}]")
-                
+                    render = _DIALOGUE_RENDERERS.get(type(response))
+                    if render is not None:
+                        dialogue_text.append(render(response))
+
                 return "\n".join(dialogue_text)
         return f"You try to talk to {npc_name}, but they don't respond."
 
@@ -1076,82 +1102,77 @@ class GameEngine:
 
     def add_experience(self, amount: int) -> None:
         """Add experience points and handle level ups."""
-        self.game_state.experience += amount
+        game_state = self.game_state
         # Every 100 XP grants a skill point
-        new_skill_points = self.game_state.experience // 100
+        new_skill_points, remainder = divmod(game_state.experience + amount, 100)
         if new_skill_points > 0:
-            self.game_state.skill_points += new_skill_points
-            self.game_state.experience %= 100
+            game_state.skill_points += new_skill_points
+            game_state.experience = remainder
+        else:
+            game_state.experience += amount
 
     def _handle_show_inventory(self) -> str:
         """Handle showing the player's inventory."""
         inventory = self.game_state.inventory_manager
-        response = "Inventory:\n"
+        parts = ["Inventory:\n"]
         
         # Show equipped items
         equipped = inventory.equipped_items
-        if any(equipped.values()):
-            response += "\nEquipped Items:\n"
+        has_equipped = any(equipped.values())
+        if has_equipped:
+            parts.append("\nEquipped Items:\n")
             for slot, item in equipped.items():
                 if item:
-                    response += f"- {slot.name}: {item.name}\n"
-                    response += f"  Description: {item.description}\n"
-                    response += f"  Type: {next(iter(item.categories)).value}\n"
-                    response += f"  Weight: {item.weight}\n"
+                    parts.append(f"- {slot.name}: {item.name}\n")
+                    parts.append(f"  Description: {item.description}\n")
+                    parts.append(f"  Type: {next(iter(item.categories)).value}\n")
+                    parts.append(f"  Weight: {item.weight}\n")
                     if hasattr(item, 'effects') and item.effects:
-                        response += "  Effects:\n"
+                        parts.append("  Effects:\n")
                         for effect in item.effects:
-                            response += f"    • {effect.attribute.title()}: {effect.value:+g}"
-                            if effect.description:
-                                response += f" ({effect.description})"
-                            response += "\n"
-                    response += "\n"
+                            suffix = f" ({effect.description})" if effect.description else ""
+                            parts.append(f"    • {effect.attribute.title()}: {effect.value:+g}{suffix}\n")
+                    parts.append("\n")
         
         # Show carried items
         carried = inventory.items
         if carried:
-            response += "\nCarried Items:\n"
+            parts.append("\nCarried Items:\n")
             for item in carried:
-                response += f"- {item.name}"
-                if item.quantity > 1:
-                    response += f" (x{item.quantity})"
-                response += f"\n  Description: {item.description}\n"
-                response += f"  Type: {next(iter(item.categories)).value}\n"
-                response += f"  Weight: {item.weight}\n"
+                qty_suffix = f" (x{item.quantity})" if item.quantity > 1 else ""
+                parts.append(f"- {item.name}{qty_suffix}\n")
+                parts.append(f"  Description: {item.description}\n")
+                parts.append(f"  Type: {next(iter(item.categories)).value}\n")
+                parts.append(f"  Weight: {item.weight}\n")
                 if hasattr(item, 'effects') and item.effects:
-                    response += "  Effects:\n"
+                    parts.append("  Effects:\n")
                     for effect in item.effects:
-                        response += f"    • {effect.attribute.title()}: {effect.value:+g}"
-                        if effect.description:
-                            response += f" ({effect.description})"
-                        response += "\n"
-                response += "\n"
+                        suffix = f" ({effect.description})" if effect.description else ""
+                        parts.append(f"    • {effect.attribute.title()}: {effect.value:+g}{suffix}\n")
+                parts.append("\n")
         
         # Show containers
         containers = inventory.containers
         if containers:
-            response += "\nContainers:\n"
+            parts.append("\nContainers:\n")
             for container in containers:
-                response += f"- {container.name}\n"
-                response += f"  Description: {container.description}\n"
-                response += f"  Type: {next(iter(container.categories)).value}\n"
-                response += f"  Weight: {container.weight}\n"
-                response += f"  Capacity: {container.capacity}\n"
+                parts.append(f"- {container.name}\n")
+                parts.append(f"  Description: {container.description}\n")
+                parts.append(f"  Type: {next(iter(container.categories)).value}\n")
+                parts.append(f"  Weight: {container.weight}\n")
+                parts.append(f"  Capacity: {container.capacity}\n")
                 if container.contents:
-                    current_weight = sum(item.weight * item.quantity for item in container.contents)
-                    response += f"  Current Weight: {current_weight}/{container.capacity}\n"
-                    response += "  Contents:\n"
+                    parts.append(f"  Current Weight: {container.current_weight}/{container.capacity}\n")
+                    parts.append("  Contents:\n")
                     for item in container.contents:
-                        response += f"    • {item.name}"
-                        if item.quantity > 1:
-                            response += f" (x{item.quantity})"
-                        response += "\n"
-                response += "\n"
+                        qty_suffix = f" (x{item.quantity})" if item.quantity > 1 else ""
+                        parts.append(f"    • {item.name}{qty_suffix}\n")
+                parts.append("\n")
         
-        if not any(equipped.values()) and not carried and not containers:
-            response += "Your inventory is empty."
+        if not (has_equipped or carried or containers):
+            parts.append("Your inventory is empty.")
         
-        return response
+        return "".join(parts)
 
     def _handle_equip_item(self, item_name: str) -> str:
         """Handle equipping an item."""
@@ -1167,10 +1188,9 @@ class GameEngine:
 
     def _handle_unequip_item(self, slot_name: str) -> str:
         """Handle unequipping an item from a slot."""
-        try:
-            slot = WearableSlot[slot_name.upper()]
-        except KeyError:
-            return f"Invalid slot: {slot_name}. Valid slots are: {', '.join(s.name for s in WearableSlot)}"
+        slot = _SLOTS_BY_NAME.get(slot_name.upper())
+        if slot is None:
+            return f"Invalid slot: {slot_name}. Valid slots are: {_VALID_SLOT_NAMES}"
         
         # Get the currently equipped item before unequipping
         equipped_item = self.game_state.inventory_manager.equipped_items.get(slot)
@@ -1191,38 +1211,38 @@ class GameEngine:
             return f"You don't have '{item_name}' in your inventory."
         
         # Start with basic description
-        response = f"{item.name}:\n{item.description}\n"
+        parts = [f"{item.name}:\n{item.description}\n"]
         
         # Add type-specific information
         if isinstance(item, Wearable):
-            response += f"\nSlot: {item.slot.name}"
+            parts.append(f"\nSlot: {item.slot.name}")
             if item.set_id:
-                response += f"\nPart of set: {item.set_id}"
+                parts.append(f"\nPart of set: {item.set_id}")
             if item.effects:
-                response += "\nEffects:"
+                parts.append("\nEffects:")
                 for effect in item.effects:
-                    response += f"\n- {effect.description}"
+                    parts.append(f"\n- {effect.description}")
         
         elif isinstance(item, Container):
-            response += f"\nCapacity: {item.capacity}"
-            if hasattr(item, 'current_weight') and item.current_weight > 0:
-                response += f"\nCurrent weight: {item.current_weight}"
+            parts.append(f"\nCapacity: {item.capacity}")
+            if item.current_weight > 0:
+                parts.append(f"\nCurrent weight: {item.current_weight}")
             if item.contents:
-                response += "\nContents:"
+                parts.append("\nContents:")
                 for content in item.contents:
-                    response += f"\n- {content.name}"
+                    parts.append(f"\n- {content.name}")
         
         # If the item already has discovered hidden information, just show it
         if item.discovered:
             if item.hidden_lore:
-                response += f"\n\nLore: {item.hidden_lore}"
+                parts.append(f"\n\nLore: {item.hidden_lore}")
             if item.hidden_clues:
-                response += "\n\nClues:"
+                parts.append("\n\nClues:")
                 for clue in item.hidden_clues:
-                    response += f"\n- {clue}"
+                    parts.append(f"\n- {clue}")
             if item.hidden_usage:
-                response += f"\n\nUsage: {item.hidden_usage}"
-            return response
+                parts.append(f"\n\nUsage: {item.hidden_usage}")
+            return "".join(parts)
         
         # Try to discover hidden information through skill checks
         discovered_something = False
@@ -1236,14 +1256,14 @@ class GameEngine:
             
             if perception_success:
                 # Notify player of successful check
-                response += f"\n\n[Perception Check: Success (Roll: {roll}/{difficulty})]"
+                parts.append(f"\n\n[Perception Check: Success (Roll: {roll}/{difficulty})]")
                 discovered_something = True
                 
                 # Reveal hidden clues on successful perception check
                 if item.hidden_clues:
-                    response += "\n\nYou notice:"
+                    parts.append("\n\nYou notice:")
                     for clue in item.hidden_clues:
-                        response += f"\n- {clue}"
+                        parts.append(f"\n- {clue}")
         
         # Perform wisdom check if needed
         if item.wisdom_difficulty > 0 and has_hidden_info:
@@ -1251,21 +1271,21 @@ class GameEngine:
             
             if wisdom_success:
                 # Notify player of successful check
-                response += f"\n\n[Wisdom Check: Success (Roll: {roll}/{difficulty})]"
+                parts.append(f"\n\n[Wisdom Check: Success (Roll: {roll}/{difficulty})]")
                 discovered_something = True
                 
                 # Reveal lore and usage hints on successful wisdom check
                 if item.hidden_lore:
-                    response += f"\n\nYou recall: {item.hidden_lore}"
+                    parts.append(f"\n\nYou recall: {item.hidden_lore}")
                 
                 if item.hidden_usage:
-                    response += f"\n\nYou realize: {item.hidden_usage}"
+                    parts.append(f"\n\nYou realize: {item.hidden_usage}")
         
         # Mark as discovered if any checks succeeded
         if discovered_something:
             item.discovered = True
         
-        return response
+        return "".join(parts)
 
     def _handle_use_item(self, item_name: str) -> str:
         """Handle using a consumable item."""
@@ -1277,9 +1297,10 @@ class GameEngine:
             return f"You can't use {item.name} - it's not a consumable item."
         
         # Apply effects
+        attributes = self.game_state.player.attributes
         for effect in item.effects:
-            if effect.attribute in self.game_state.player.attributes:
-                self.game_state.player.attributes[effect.attribute] += effect.value
+            if effect.attribute in attributes:
+                attributes[effect.attribute] += effect.value
         
         # Remove item if it's not stackable or if it's the last one
         if not item.stackable or item.quantity == 1:
@@ -1298,17 +1319,15 @@ class GameEngine:
         if not isinstance(container, Container):
             return f"You can't open {container.name} - it's not a container."
         
-        response = f"Contents of {container.name}:\n"
+        parts = [f"Contents of {container.name}:\n"]
         if container.contents:
             for item in container.contents:
-                response += f"- {item.name}"
-                if item.quantity > 1:
-                    response += f" (x{item.quantity})"
-                response += "\n"
+                qty_suffix = f" (x{item.quantity})" if item.quantity > 1 else ""
+                parts.append(f"- {item.name}{qty_suffix}\n")
         else:
-            response += "The container is empty."
+            parts.append("The container is empty.")
         
-        return response
+        return "".join(parts)
 
     def _handle_put_in_container(self, item_name: str, container_name: str) -> str:
         """Handle putting an item in a container."""
@@ -1323,7 +1342,8 @@ class GameEngine:
         if not isinstance(container, Container):
             return f"You can't put items in {container.name} - it's not a container."
         
-        if item in container.contents:
+        # Identity check; dataclass equality would compare every field
+        if any(content is item for content in container.contents):
             return f"{item.name} is already in {container.name}."
         
         if container.current_weight + item.weight > container.capacity:
@@ -1346,7 +1366,8 @@ class GameEngine:
         if not isinstance(container, Container):
             return f"You can't take items from {container.name} - it's not a container."
         
-        item = next((i for i in container.contents if i.name.lower() == item_name.lower()), None)
+        target = item_name.lower()
+        item = next((i for i in container.contents if i.name_lower == target), None)
         if not item:
             return f"{item_name} is not in {container.name}."
         
@@ -1357,26 +1378,7 @@ class GameEngine:
 
     def _find_item_in_inventory(self, item_name: str) -> Optional[Item]:
         """Find an item in the inventory by name."""
-        inventory = self.game_state.inventory_manager
-        
-        # Combine all items from equipped, inventory, and containers
-        all_items = (
-            list(filter(None, inventory.equipped_items.values())) +  # Equipped items
-            inventory.items +  # Regular inventory items
-            inventory.containers  # Containers
-        )
-        
-        # First try exact match
-        for item in all_items:
-            if item and item.name.lower() == item_name.lower():
-                return item
-        
-        # Then try partial match
-        for item in all_items:
-            if item and item_name.lower() in item.name.lower():
-                return item
-        
-        return None
+        return self.game_state.inventory_manager.find_item_by_name(item_name)
 
     def _perform_skill_check(self, skill_name: str, difficulty: int) -> tuple[bool, int, int]:
         """
@@ -1389,9 +1391,7 @@ class GameEngine:
         Returns:
             tuple[bool, int, int]: Success result, roll value, difficulty
         """
-        player_skill = 0
-        if skill_name in self.game_state.player.skills:
-            player_skill = self.game_state.player.skills[skill_name]
+        player_skill = self.game_state.player.skills.get(skill_name, 0)
         
         # Roll a d20
         roll = random.randint(1, 20)
@@ -1414,7 +1414,6 @@ class GameEngine:
             
             # Update current location
             self.current_location = location_id
-            self.game_state.current_location = location_id
             
             # Mark as visited
             self.game_state.visited_locations.add(location_id)
@@ -1436,8 +1435,9 @@ class GameEngine:
         target_item = None
         target_item_id = None
         
+        needle = item_name.lower()
         for item in location_items:
-            if item_name.lower() in item.name.lower():
+            if needle in item.name.lower():
                 target_item = item
                 target_item_id = item.id
                 break
@@ -1504,8 +1504,9 @@ class GameEngine:
         container = None
         container_id = None
         
+        container_needle = container_name.lower()
         for item in location_items:
-            if container_name.lower() in item.name.lower() and isinstance(item, Container):
+            if container_needle in item.name.lower() and isinstance(item, Container):
                 container = item
                 container_id = item.id
                 break
@@ -1520,8 +1521,9 @@ class GameEngine:
         target_item = None
         target_item_id = None
         
+        needle = item_name.lower()
         for item in container_items:
-            if item_name.lower() in item.name.lower():
+            if needle in item.name.lower():
                 target_item = item
                 target_item_id = item.id
                 break
@@ -1563,8 +1565,9 @@ class GameEngine:
         container = None
         container_id = None
         
+        container_needle = container_name.lower()
         for loc_item in location_items:
-            if container_name.lower() in loc_item.name.lower() and isinstance(loc_item, Container):
+            if container_needle in loc_item.name.lower() and isinstance(loc_item, Container):
                 container = loc_item
                 container_id = loc_item.id
                 break
@@ -1635,7 +1638,10 @@ class GameEngine:
         return response
         
     def _handle_search_area(self, area_name: str) -> str:
-        """Handle searching a specific area in the current location."""
+        """Handle searching a specific area in the current location.
+
+        area_name must already be lower-case; process_input case-folds the whole input once.
+        """
         response = f"You search the {area_name} carefully...\n\n"
         
         # Get all items in the current location
@@ -1646,7 +1652,7 @@ class GameEngine:
         container_id = None
         
         for item in location_items:
-            if area_name.lower() in item.name.lower() and isinstance(item, Container):
+            if area_name in item.name.lower() and isinstance(item, Container):
                 container = item
                 container_id = item.id
                 break
@@ -1669,20 +1675,14 @@ class GameEngine:
         found_items = []
         
         for item in location_items:
+            name_matches = area_name in item.name.lower()
+
             # Skip obvious items unless they're related to the area
-            if getattr(item, 'is_obvious', True) and area_name.lower() not in item.name.lower():
+            if getattr(item, 'is_obvious', True) and not name_matches:
                 continue
                 
-            # Check if item matches the area
-            area_matches = False
-            
-            # Check name
-            if area_name.lower() in item.name.lower():
-                area_matches = True
-                
-            # Check description
-            if area_name.lower() in item.description.lower():
-                area_matches = True
+            # Check if item matches the area by name or description
+            area_matches = name_matches or area_name in item.description.lower()
                 
             # If it matches, check perception
             if area_matches:
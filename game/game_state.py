@@ -205,6 +205,10 @@ class GameState:
         """Get all failed quests."""
         return list(self._quest_state.get_failed_quests().values())
 
+    def get_quests_by_status(self) -> Dict[QuestStatus, List[Quest]]:
+        """Get all quests grouped by status."""
+        return self._quest_state.get_quests_by_status()
+
     def set_active_stage(self, quest_id: str, stage_id: str) -> None:
         """Set the active stage for a quest."""
         self._quest_state.set_active_stage(quest_id, stage_id)
@@ -213,6 +217,10 @@ class GameState:
         """Get the active stage ID for a quest."""
         return self._quest_state.get_active_stage(quest_id)
 
+    def get_current_stage(self, quest_id: str) -> Optional[QuestStage]:
+        """Get the active stage object for a quest."""
+        return self._quest_state.get_current_stage(quest_id)
+
     def add_completed_objective(self, quest_id: str, objective_id: str) -> None:
         """Mark an objective as completed."""
         return self._quest_state.add_completed_objective(quest_id, objective_id)
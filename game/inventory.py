@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import cached_property
+from itertools import chain
 from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 
@@ -57,6 +59,11 @@ class ItemBase:
     # Track if hidden properties have been discovered already
     discovered: bool = False
 
+    @cached_property
+    def name_lower(self) -> str:
+        """Lower-cased name, used for case-insensitive lookups."""
+        return self.name.lower()
+
 
 @dataclass(init=False)
 class Item(ItemBase):
@@ -151,7 +158,7 @@ class Wearable(ItemBase):
 class Container(ItemBase):
     """A special item that can hold other items."""
     capacity: float
-    allowed_categories: Set[ItemCategory]
+    allowed_categories: Optional[Set[ItemCategory]]
     contents: List[ItemBase] = field(default_factory=list)
 
     def __init__(
@@ -161,7 +168,7 @@ class Container(ItemBase):
         description: str,
         categories: Set[ItemCategory],
         capacity: float,
-        allowed_categories: Set[ItemCategory],
+        allowed_categories: Optional[Set[ItemCategory]],
         weight: float = 0.0,
         effects: List[Effect] = None,
         contents: List[ItemBase] = None,
@@ -191,8 +198,27 @@ class Container(ItemBase):
             discovered=discovered
         )
         self.capacity = capacity
-        self.allowed_categories = allowed_categories
+        # None (no allowed_categories in the config) means any item fits
+        self.allowed_categories = set(allowed_categories) if allowed_categories is not None else None
         self.contents = contents if contents is not None else []
+
+    def is_allowed_category(self, categories: Set[ItemCategory]) -> bool:
+        """Check whether an item with the given categories may be stored here."""
+        allowed = self.allowed_categories
+        if allowed is None:
+            return True
+        return any(category in allowed for category in categories)
+
+    @property
+    def current_weight(self) -> float:
+        """Total weight of the container's contents.
+
+        Summed on each access rather than kept as a running total, because
+        callers (location setup, save loading, InventoryManager) append to
+        and pop from ``contents`` directly; containers hold only a handful
+        of items, so the scan is cheap.
+        """
+        return sum(item.weight * item.quantity for item in self.contents)
     
     def add_item(self, item: Item) -> bool:
         """Add an item to the container.
@@ -204,12 +230,11 @@ class Container(ItemBase):
             bool: True if item was added successfully, False if rejected
         """
         # Check if item category is allowed
-        if not any(category in self.allowed_categories for category in item.categories):
+        if not self.is_allowed_category(item.categories):
             return False
             
         # Calculate total weight including existing contents
-        current_weight = sum(item.weight * item.quantity for item in self.contents)
-        new_weight = current_weight + (item.weight * item.quantity)
+        new_weight = self.current_weight + (item.weight * item.quantity)
         
         # Check if adding item would exceed capacity
         if new_weight > self.capacity:
@@ -259,6 +284,8 @@ class InventoryManager:
         self.current_weight = 0.0
         self._active_effects: List[Effect] = []
         self._set_bonuses: Dict[str, List[Effect]] = {}
+        # Lower-cased name -> equipped or carried item, rebuilt lazily after changes
+        self._name_index: Optional[Dict[str, Item]] = None
 
     def add_item(self, item: Item) -> bool:
         """Add an item to the inventory if there's capacity."""
@@ -276,6 +303,7 @@ class InventoryManager:
         
         self.items.append(item)
         self.current_weight = new_weight
+        self._name_index = None
         return True
 
     def remove_item(self, item_id: str, quantity: int = 1) -> Optional[Item]:
@@ -288,6 +316,7 @@ class InventoryManager:
                     return item
                 else:
                     self.current_weight -= item.weight * item.quantity
+                    self._name_index = None
                     return self.items.pop(i)
         return None
 
@@ -304,6 +333,7 @@ class InventoryManager:
         # Equip the item
         self.equipped_items[item.slot] = item
         self.items.remove(item)
+        self._name_index = None
         self._update_active_effects()
         self._check_set_bonuses()
         
@@ -317,6 +347,7 @@ class InventoryManager:
 
         if self.add_item(item):
             self.equipped_items[slot] = None
+            self._name_index = None
             self._update_active_effects()
             self._check_set_bonuses()
             return True, f"Unequipped {item.name}"
@@ -401,6 +432,37 @@ class InventoryManager:
         # This is a placeholder for the actual set bonus logic
         pass
 
+    def find_item_by_name(self, name: str) -> Optional[Item]:
+        """
+        Find an equipped, carried or container item by name.
+        An exact (case-insensitive) match wins over a partial one.
+        """
+        key = name.lower()
+        if self._name_index is None:
+            index: Dict[str, Item] = {}
+            for item in self.equipped_items.values():
+                if item:
+                    index.setdefault(item.name_lower, item)
+            for item in self.items:
+                index.setdefault(item.name_lower, item)
+            self._name_index = index
+
+        item = self._name_index.get(key)
+        if item is not None:
+            return item
+
+        # Containers aren't indexed since callers may add them directly, so
+        # one pass looks for an exact container match while remembering the
+        # first partial match in equipped/carried/container order
+        partial = None
+        for item in chain(filter(None, self.equipped_items.values()), self.items, self.containers):
+            name = item.name_lower
+            if name == key:
+                return item
+            if partial is None and key in name:
+                partial = item
+        return partial
+
     def get_items_by_category(self, category: ItemCategory) -> List[Item]:
         """Get all items of a specific category."""
         items = [item for item in self.items if category in item.categories]
@@ -420,11 +482,11 @@ class InventoryManager:
         if not container:
             return False
 
-        if any(cat not in container.allowed_categories for cat in item.categories):
+        allowed = container.allowed_categories
+        if allowed is not None and not allowed.issuperset(item.categories):
             return False
 
-        current_weight = sum(i.weight * i.quantity for i in container.contents)
-        if current_weight + (item.weight * item.quantity) > container.capacity:
+        if container.current_weight + (item.weight * item.quantity) > container.capacity:
             return False
 
         container.contents.append(item)
@@ -44,8 +44,8 @@ class Quest:
             
         current_index = self.stages.index(current_stage)
         if current_index + 1 < len(self.stages):
-            current_stage.status = "Completed"
+            current_stage.status = QuestStatus.Completed
             next_stage = self.stages[current_index + 1]
-            next_stage.status = "InProgress"
+            next_stage.status = QuestStatus.InProgress
             return True
         return False 
\ No newline at end of file
@@ -28,7 +28,7 @@ class QuestNotification:
     title: str
     message: str
     type: NotificationType
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = field(default_factory=time.monotonic)  # Seconds on the monotonic clock
     is_new: bool = field(default=True)
 
 
@@ -211,15 +211,7 @@ class QuestManager:
     
     def get_quest_stage(self, quest_id: str) -> Optional[QuestStage]:
         """Get the current stage of a quest."""
-        quest = self.game_state.get_quest(quest_id)
-        if not quest:
-            return None
-        
-        active_stage_id = self.game_state.get_active_stage(quest_id)
-        if not active_stage_id:
-            return None
-            
-        return next((stage for stage in quest.stages if stage.id == active_stage_id), None)
+        return self.game_state.get_current_stage(quest_id)
     
     def is_objective_completed(self, quest_id: str, objective_id: str) -> bool:
         """Check if a quest objective is completed."""
@@ -245,10 +237,7 @@ class QuestManager:
         """Get all active notifications."""
         return [n for n in self.notifications if n.is_new]
 
-    def clear_old_notifications(self, max_age: int) -> None:
-        """Clear notifications older than max_age seconds."""
-        current_time = time.time()
-        self.notifications = [
-            n for n in self.notifications 
-            if current_time - n.timestamp < max_age
-        ]
+    def drain_notifications(self) -> List[QuestNotification]:
+        """Get all active notifications and remove every notification from the manager."""
+        notifications, self.notifications = self.notifications, []
+        return [n for n in notifications if n.is_new]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional
 from game.quest_status import QuestStatus
 from config.config_loader import Quest, QuestStage
 
@@ -11,6 +11,7 @@ class QuestState:
     active_stages: Dict[str, str] = field(default_factory=dict)
     taken_branches: Dict[str, Set[str]] = field(default_factory=dict)
     quest_items: Dict[str, Set[str]] = field(default_factory=dict)
+    current_stages: Dict[str, QuestStage] = field(default_factory=dict)
 
     def add_quest(self, quest: Quest) -> None:
         """Add a quest to the state or update an existing quest."""
@@ -26,6 +27,8 @@ class QuestState:
                 self.taken_branches[quest.id] = set()
             if quest.id not in self.quest_items:
                 self.quest_items[quest.id] = set()
+            # The stage objects belong to the replaced quest, so re-resolve the pointer
+            self._update_current_stage(quest.id)
         else:
             # Add new quest
             self.quests[quest.id] = quest
@@ -57,12 +60,27 @@ class QuestState:
         if quest_id not in self.quests:
             return False
         self.active_stages[quest_id] = stage_id
+        self._update_current_stage(quest_id)
         return True
 
     def get_active_stage(self, quest_id: str) -> Optional[str]:
         """Get the active stage ID for a quest."""
         return self.active_stages.get(quest_id)
 
+    def get_current_stage(self, quest_id: str) -> Optional[QuestStage]:
+        """Get the active stage object for a quest."""
+        return self.current_stages.get(quest_id)
+
+    def _update_current_stage(self, quest_id: str) -> None:
+        """Resolve the active stage ID to its stage object when the stage changes."""
+        stage_id = self.active_stages.get(quest_id)
+        stage = next((stage for stage in self.quests[quest_id].stages
+                      if stage.id == stage_id), None) if stage_id else None
+        if stage:
+            self.current_stages[quest_id] = stage
+        else:
+            self.current_stages.pop(quest_id, None)
+
     def add_completed_objective(self, quest_id: str, objective_id: str) -> bool:
         """Mark an objective as completed."""
         if quest_id not in self.quests:
@@ -126,6 +144,13 @@ class QuestState:
         """Get all failed quests."""
         return {qid: quest for qid, quest in self.quests.items() 
                 if quest.status == QuestStatus.Failed} 
+
+    def get_quests_by_status(self) -> Dict[QuestStatus, List[Quest]]:
+        """Group all quests by status in a single pass."""
+        by_status = {status: [] for status in QuestStatus}
+        for quest in self.quests.values():
+            by_status.setdefault(quest.status, []).append(quest)
+        return by_status
     
     def check_all_quest_updates(self) -> None:
         """Check for all quest updates."""
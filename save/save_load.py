@@ -6,7 +6,7 @@ import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from game.game_state import (Clue, GameState, Item, Player, QuestStatus,
                              TimeOfDay, Container, Wearable, ItemCategory, WearableSlot)
@@ -293,6 +293,8 @@ class SaveManager:
     def __init__(self):
         """Initialize the save manager."""
         self.save_dir = SAVE_DIR
+        # Last list_saves() result, tagged with the save directory's mtime
+        self._list_cache: Optional[Tuple[int, List[SaveMetadata]]] = None
         
         # Create save directory if it doesn't exist
         if not os.path.exists(self.save_dir):
@@ -324,6 +326,7 @@ class SaveManager:
         )
         
         # Serialize to JSON
+        self._list_cache = None
         with open(save_path, 'w', encoding='utf-8') as file:
             json.dump(save_data, file, cls=GameStateEncoder, indent=2)
     
@@ -360,6 +363,12 @@ class SaveManager:
         # List all .save files in the save directory
         if not os.path.exists(self.save_dir):
             return saves
+
+        # Reading metadata parses every save file, so reuse the last listing
+        # while the directory is unchanged
+        dir_mtime = os.stat(self.save_dir).st_mtime_ns
+        if self._list_cache and self._list_cache[0] == dir_mtime:
+            return list(self._list_cache[1])
         
         for filename in os.listdir(self.save_dir):
             if filename.endswith('.save'):
@@ -372,13 +381,15 @@ class SaveManager:
         
         # Sort by timestamp (newest first)
         saves.sort(key=lambda x: x.timestamp, reverse=True)
-        
-        return saves
+
+        self._list_cache = (dir_mtime, saves)
+        return list(saves)
     
     def delete_save(self, filename: str) -> None:
         """Delete a save file."""
         save_path = os.path.join(self.save_dir, filename)
         if os.path.exists(save_path):
+            self._list_cache = None
             os.remove(save_path)
         else:
             raise FileNotFoundError(f"Save file not found: {filename}")
@@ -0,0 +1,25 @@
+from config.config_loader import ConfigLoader
+from game.inventory import ItemCategory
+
+
+def test_location_item_categories_are_converted_once():
+    loc_data = {
+        "location_items": [{"id": "mug", "categories": ["TOOL", "bogus"]}],
+        "location_containers": [
+            {
+                "id": "drawer",
+                "categories": ["container"],
+                "contents": [{"id": "logs", "categories": ["EVIDENCE", "QUEST_ITEM"]}],
+            }
+        ],
+    }
+    ConfigLoader.normalize_location_items(loc_data)
+
+    assert loc_data["location_items"][0]["categories"] == {ItemCategory.TOOL}
+    drawer = loc_data["location_containers"][0]
+    assert drawer["categories"] == {ItemCategory.CONTAINER}
+    assert drawer["contents"][0]["categories"] == {ItemCategory.EVIDENCE, ItemCategory.QUEST_ITEM}
+
+    # Already-converted data is left as is
+    ConfigLoader.normalize_location_items(loc_data)
+    assert drawer["categories"] == {ItemCategory.CONTAINER}
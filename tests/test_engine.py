@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
 from game.engine import GameEngine
-from config.config_loader import GameConfig, GameSettings, Location
+from config.config_loader import GameConfig, GameSettings, Location, NPC
 
 @pytest.fixture
 def setup_engine():
@@ -28,25 +28,21 @@ def setup_engine():
         ),
     }
     
-    # Create a simple NPC class for testing
-    class TestNPC:
-        def __init__(self, id, name, location, gender):
-            self.id = id
-            self.name = name
-            self.location = location
-            self.gender = gender
-    
-    # Mock NPCs using the test class instead of MagicMock
+    # Use real NPC config objects instead of MagicMock
     mock_config.npcs = {
-        "worker_chen": TestNPC(
+        "worker_chen": NPC(
             id="worker_chen",
             name="Sarah Chen",
+            dialogue_entry_point="chen_greeting",
+            disposition=50,
             location="warehouse_entrance",
             gender="female"
         ),
-        "guard_martinez": TestNPC(
+        "guard_martinez": NPC(
             id="guard_martinez",
             name="Officer Martinez",
+            dialogue_entry_point="martinez_greeting",
+            disposition=50,
             location="warehouse_office",
             gender="male"
         )
@@ -163,51 +159,57 @@ def test_missing_target_location(setup_engine):
     response = engine._handle_movement("warehouse_office")
     assert response == "You can't go to the warehouse_office from here. There are no valid exits."
 
-def test_find_closest_location_match_single_match(setup_engine):
-    engine, _ = setup_engine
-    connected_locations = ["warehouse_office", "town_square"]
-    result = engine._find_closest_location_match("office", connected_locations)
+def _locations(config, *location_ids):
+    return [config.locations[location_id] for location_id in location_ids]
+
+def test_match_location_single_match(setup_engine):
+    engine, mock_config = setup_engine
+    candidates = _locations(mock_config, "warehouse_office", "town_square")
+    result = engine._match_location("office", candidates)
     assert result == "warehouse_office"
 
-def test_find_closest_location_match_multiple_matches(setup_engine):
+def test_match_location_multiple_matches(setup_engine):
     engine, mock_config = setup_engine
     mock_config.locations["warehouse_office"].name = "Warehouse Store"
     mock_config.locations["town_square"].name = "Warehouse Market"
-    connected_locations = ["warehouse_office", "town_square"]
+    candidates = _locations(mock_config, "warehouse_office", "town_square")
     with pytest.raises(ValueError) as excinfo:
-        engine._find_closest_location_match("warehouse", connected_locations)
+        engine._match_location("warehouse", candidates)
     assert "Ambiguous direction: multiple locations match 'warehouse'" in str(excinfo.value)
 
-def test_find_closest_location_match_no_matches(setup_engine):
-    engine, _ = setup_engine
-    connected_locations = ["warehouse_office", "town_square"]
-    result = engine._find_closest_location_match("ocean", connected_locations)
+def test_match_location_no_matches(setup_engine):
+    engine, mock_config = setup_engine
+    candidates = _locations(mock_config, "warehouse_office", "town_square")
+    result = engine._match_location("ocean", candidates)
     assert result is None
 
-def test_find_closest_location_match_partial_name(setup_engine):
-    engine, _ = setup_engine
-    connected_locations = ["warehouse_office", "town_square"]
-    result = engine._find_closest_location_match("square", connected_locations)
+def test_match_location_partial_name(setup_engine):
+    engine, mock_config = setup_engine
+    candidates = _locations(mock_config, "warehouse_office", "town_square")
+    result = engine._match_location("square", candidates)
     assert result == "town_square"
 
-def test_find_closest_location_match_partial_id(setup_engine):
-    engine, _ = setup_engine
-    connected_locations = ["warehouse_office", "town_square"]
-    result = engine._find_closest_location_match("office", connected_locations)
+def test_match_location_partial_id(setup_engine):
+    engine, mock_config = setup_engine
+    candidates = _locations(mock_config, "warehouse_office", "town_square")
+    result = engine._match_location("warehouse_off", candidates)
     assert result == "warehouse_office"
 
-def test_find_closest_location_match_empty_connected_locations(setup_engine):
+def test_match_location_no_candidates(setup_engine):
     engine, _ = setup_engine
-    connected_locations = []
-    result = engine._find_closest_location_match("warehouse_office", connected_locations)
+    result = engine._match_location("warehouse_office", [])
     assert result is None
 
-def test_find_closest_location_match_invalid_location_in_config(setup_engine):
+def test_movement_skips_exits_missing_from_config(setup_engine):
     engine, mock_config = setup_engine
     mock_config.locations.pop("warehouse_office")  # Remove "warehouse_office" from config
-    connected_locations = ["warehouse_office", "town_square"]
-    result = engine._find_closest_location_match("warehouse_office", connected_locations)
-    assert result is None
+    response = engine._handle_movement("warehouse_office")
+    assert response == "You can't go to the warehouse_office from here. Valid exits are: Town Square."
+
+def test_movement_matches_mixed_case_direction(setup_engine):
+    engine, _ = setup_engine
+    engine.process_input("go to the Town SQUARE")
+    assert engine.current_location == "town_square"
 
 def test_movement_with_natural_language(setup_engine):
     engine, _ = setup_engine
@@ -241,3 +243,285 @@ def test_npc_name_matching(setup_engine):
     assert engine._find_matching_npc("sarah")[0] == "worker_chen"
     assert engine._find_matching_npc("chen")[0] == "worker_chen"
     assert engine._find_matching_npc("sarah chen")[0] == "worker_chen"
+
+def test_where_can_i_go_phrase(setup_engine):
+    engine, _ = setup_engine
+    response = engine.process_input("where  can i go")
+    assert response == "From here, you can go to the Warehouse Office or the Town Square."
+
+def test_partial_multiword_phrase_is_unknown(setup_engine):
+    engine, _ = setup_engine
+    response = engine.process_input("where can i")
+    assert response.startswith("Unknown command.")
+
+def test_look_around_lists_npcs_and_exits(setup_engine):
+    engine, _ = setup_engine
+    response = engine._handle_look_around()
+    assert response == (
+        "You are at the starting point."
+        "\n\nYou see:\n- Sarah Chen"
+        "\n\nFrom here, you can see:\n- The Warehouse Office\n- The Town Square"
+    )
+
+def test_single_word_command_fast_path(setup_engine):
+    engine, _ = setup_engine
+    assert engine.process_input("  EXITS ") == "From here, you can go to the Warehouse Office or the Town Square."
+    assert engine.process_input("help").startswith("Available commands:")
+
+def test_verb_dispatch_synonyms_and_fallbacks(setup_engine):
+    engine, _ = setup_engine
+    assert engine.process_input("directions please") == engine.process_input("exits")
+    assert engine.process_input("talk to the") == "Who would you like to talk to?"
+    assert engine.process_input("walk") == "Where would you like to go?"
+    assert engine.process_input("look").startswith("Unknown command.")
+    assert engine.process_input("dance").startswith("Unknown command.")
+
+def test_npcs_indexed_by_location(setup_engine):
+    engine, _ = setup_engine
+    assert [npc.id for npc in engine._npcs_here()] == ["worker_chen"]
+    engine.current_location = "town_square"
+    assert engine._npcs_here() == ()
+    assert engine._handle_talk_to_npc("anyone") == "There's no one here to talk to."
+
+def test_config_objects_cache_lowercase_names():
+    location = Location(id="Town_Square", name="Town Square", description="")
+    npc = NPC(id="chen", name="Sarah Chen", dialogue_entry_point="start",
+              disposition=50, location="town_square", gender="female")
+    assert location.name_lower == "town square"
+    assert location.id_lower == "town_square"
+    assert npc.name_parts_lower == ("sarah", "chen")
+
+def test_current_location_object_follows_moves(setup_engine):
+    engine, mock_config = setup_engine
+    assert engine._current_location_obj is mock_config.locations["warehouse_entrance"]
+    engine.process_input("go to town square")
+    assert engine._current_location_obj is mock_config.locations["town_square"]
+    engine.current_location = "nowhere"
+    assert engine._current_location_obj is None
+
+def test_exits_text_is_cached_per_location(setup_engine):
+    engine, mock_config = setup_engine
+    first = engine._handle_show_exits()
+    assert engine._exits_cache["warehouse_entrance"].sentence == first
+    assert engine._handle_show_exits() is first
+    engine.current_location = "town_square"
+    assert engine._handle_show_exits() == "From here, you can go to the Warehouse Entrance."
+
+def test_talk_text_fallback_renders_responses(setup_engine):
+    from dialogue.node import DialogueOption
+    from dialogue.response import DialogueResponse
+
+    engine, _ = setup_engine
+    engine.dialogue_handler = MagicMock()
+    engine.dialogue_handler.start_dialogue.return_value = [
+        DialogueResponse.Speech(speaker="Sarah Chen", text="Hello."),
+        DialogueResponse.InnerVoice(voice_type="Logic", text="She is nervous."),
+        DialogueResponse.SkillCheck(success=True, skill="Empathy", player_skill=3, roll=8, difficulty=7),
+        DialogueResponse.Options(options=[DialogueOption(id="a", text="Ask about the box", next_node="n")]),
+    ]
+    assert engine._handle_talk_to_npc("sarah") == (
+        "Sarah Chen: Hello.\n"
+        "[Logic] She is nervous.\n"
+        "[Skill Check: Empathy - Success]\n"
+        "\nOptions:\n- Ask about the box"
+    )
+
+def test_search_area_matches_item_description(setup_engine):
+    from game.inventory import Item, ItemCategory
+
+    engine, _ = setup_engine
+    note = Item(id="note", name="Crumpled Note", description="Tucked under the Desk blotter.",
+                categories={ItemCategory.EVIDENCE})
+    note.is_obvious = False
+    engine.game_state.add_item_to_location("warehouse_entrance", note)
+    response = engine.process_input("search DESK")
+    assert "Crumpled Note" in response
+
+def test_quest_notifications_are_shown_once(setup_engine):
+    from quest.quest_manager import NotificationType
+
+    engine, _ = setup_engine
+    engine.quest_manager._add_notification("q", "Quest", "New quest: Test", NotificationType.QuestStarted)
+    response = engine.process_input("exits")
+    assert response.startswith("New quest: Test\n\n")
+    assert list(engine.pending_notifications) == ["New quest: Test"]
+    assert not engine.process_input("exits").startswith("New quest")
+
+def test_movement_response_uses_a_template(setup_engine):
+    engine, _ = setup_engine
+    responses = {engine._get_movement_response("Town Square", "Busy.") for _ in range(64)}
+    assert responses <= {
+        "You make your way to the Town Square.\n\nBusy.",
+        "You head over to the Town Square.\n\nBusy.",
+        "You arrive at the Town Square.\n\nBusy.",
+        "You enter the Town Square.\n\nBusy.",
+    }
+
+def test_location_changes_sync_game_state(setup_engine):
+    engine, _ = setup_engine
+    assert engine.game_state.current_location == "warehouse_entrance"
+    engine.process_input("go to town square")
+    assert engine.game_state.current_location == "town_square"
+    assert engine.game_state.previous_location == "warehouse_entrance"
+
+def test_quest_subcommands_dispatch(setup_engine):
+    engine, _ = setup_engine
+    engine.quest_manager.get_quest = MagicMock(return_value=None)
+    assert engine.process_input("quest info missing") == "Quest 'missing' not found."
+    assert engine.process_input("quest dance missing").startswith("Unknown command.")
+
+def test_unknown_direction_lists_connected_locations(setup_engine):
+    engine, _ = setup_engine
+    assert engine.process_input("go ocean") == (
+        "You can't go to the ocean from here. Valid exits are: Warehouse Office, Town Square."
+    )
+    assert [loc.id for loc in engine._connections_cache["warehouse_entrance"]] == [
+        "warehouse_office", "town_square"
+    ]
+
+def test_quest_info_and_track_output(setup_engine):
+    from config.config_loader import Quest, QuestStage
+
+    engine, _ = setup_engine
+    quest = Quest(
+        id="case", title="The Case", short_description="", description="Solve it.",
+        importance="High", is_main_quest=True, is_hidden=False, status="NotStarted",
+        stages=[QuestStage(id="s1", title="Begin", description="Look around.", status="NotStarted",
+                           objectives=[{"id": "o1", "description": "Find a clue", "is_optional": True}])],
+    )
+    engine.game_state.add_quest(quest)
+    engine.quest_manager.start_quest("case")
+
+    assert engine._handle_quest_info("case") == (
+        "Quest: The Case\nType: Main Quest\nStatus: InProgress\n\n"
+        "Description:\nSolve it.\n\n"
+        "Stages:\n- Begin [CURRENT]\n  Look around.\n  Objectives:\n  ○ (Optional) Find a clue\n\n"
+    )
+    assert engine._handle_track_quest("case") == (
+        "Tracking Quest: The Case\nCurrent Stage: Begin\nLook around.\n\n"
+        "Objectives:\n○ (Optional) Find a clue\n"
+    )
+
+def test_npc_pronoun_without_matching_gender(setup_engine):
+    engine, _ = setup_engine
+    assert engine._find_matching_npc("him") == (None, [])
+    engine.current_location = "warehouse_office"
+    assert engine._find_matching_npc("his") == ("guard_martinez", [])
+
+def test_pending_notifications_are_bounded(setup_engine):
+    from quest.quest_manager import NotificationType
+
+    engine, _ = setup_engine
+    for i in range(100):
+        engine.quest_manager._add_notification("q", "Quest", f"Update {i}", NotificationType.QuestUpdated)
+        engine.process_input("exits")
+    assert len(engine.pending_notifications) == engine.pending_notifications.maxlen
+    assert engine.pending_notifications[-1] == "Update 99"
+
+def test_unequip_slot_lookup(setup_engine):
+    engine, _ = setup_engine
+    assert engine.process_input("unequip cape") == (
+        "Invalid slot: cape. Valid slots are: HEAD, TORSO, LEGS, FEET, HANDS, NECK, RING, ACCESSORY"
+    )
+    assert engine.process_input("unequip head") == "No item equipped in that slot"
+
+def test_add_experience_grants_skill_points(setup_engine):
+    engine, _ = setup_engine
+    engine.game_state.experience = 0
+    engine.game_state.skill_points = 0
+    engine.add_experience(250)
+    assert (engine.game_state.skill_points, engine.game_state.experience) == (2, 50)
+    engine.add_experience(30)
+    assert (engine.game_state.skill_points, engine.game_state.experience) == (2, 80)
+
+def test_add_experience_negative_amount_keeps_skill_points(setup_engine):
+    engine, _ = setup_engine
+    engine.game_state.experience = 20
+    engine.game_state.skill_points = 1
+    engine.add_experience(-50)
+    assert (engine.game_state.skill_points, engine.game_state.experience) == (1, -30)
+
+def test_put_item_already_in_container(setup_engine):
+    from game.inventory import Container, Item, ItemCategory
+
+    engine, _ = setup_engine
+    inventory = engine.game_state.inventory_manager
+    pen = Item(id="pen", name="Reliable Pen", description="A sturdy pen.", categories={ItemCategory.TOOL})
+    inventory.add_item(pen)
+    satchel = Container(id="satchel", name="Satchel", description="A leather satchel.",
+                        categories={ItemCategory.CONTAINER}, capacity=5.0,
+                        allowed_categories={ItemCategory.TOOL})
+    inventory.containers.append(satchel)
+    satchel.contents.append(pen)
+    assert engine._handle_put_in_container("reliable pen", "satchel") == "Reliable Pen is already in Satchel."
+
+def test_put_item_in_carried_container(setup_engine):
+    from game.inventory import Container, Item, ItemCategory
+
+    engine, _ = setup_engine
+    inventory = engine.game_state.inventory_manager
+    pen = Item(id="pen", name="Reliable Pen", description="A sturdy pen.", categories={ItemCategory.TOOL}, weight=0.1)
+    inventory.add_item(pen)
+    inventory.containers.append(Container(id="satchel", name="Satchel", description="A leather satchel.",
+                                          categories={ItemCategory.CONTAINER}, capacity=5.0,
+                                          allowed_categories=[ItemCategory.TOOL]))
+    assert engine._handle_put_in_container("reliable pen", "satchel") == "You put Reliable Pen in Satchel."
+
+def test_put_item_in_unrestricted_container(setup_engine):
+    from game.inventory import Container, Item, ItemCategory
+
+    engine, _ = setup_engine
+    inventory = engine.game_state.inventory_manager
+    pen = Item(id="pen", name="Reliable Pen", description="A sturdy pen.", categories={ItemCategory.TOOL}, weight=0.1)
+    inventory.add_item(pen)
+    inventory.containers.append(Container(id="basket", name="Basket", description="A wicker basket.",
+                                          categories={ItemCategory.CONTAINER}, capacity=5.0,
+                                          allowed_categories=None))
+    assert engine._handle_put_in_container("reliable pen", "basket") == "You put Reliable Pen in Basket."
+
+def test_location_items_are_copied_from_templates(setup_engine):
+    from game.inventory import Container, Effect, Item, ItemCategory
+
+    _, config = setup_engine
+    tonic = Item(id="tonic", name="Tonic", description="Bitter.", categories={ItemCategory.CONSUMABLE},
+                 effects=[Effect("health", 5)])
+    crate = Container(id="crate", name="Crate", description="Wooden.", categories={ItemCategory.CONTAINER},
+                      capacity=10.0, allowed_categories={ItemCategory.CONSUMABLE})
+    config.items = {"tonic": tonic, "crate": crate}
+    config.locations["warehouse_office"].location_items = [{"id": "tonic", "is_obvious": False}]
+    config.locations["warehouse_office"].location_containers = [{"id": "crate", "contents": [{"id": "tonic"}]}]
+
+    engine = GameEngine(config)
+    placed_tonic, placed_crate = engine.game_state.get_location_items("warehouse_office")
+    assert placed_tonic is not tonic and placed_tonic.effects == tonic.effects
+    assert placed_tonic.is_obvious is False and not hasattr(tonic, "is_obvious")
+    assert placed_crate is not crate and crate.contents == []
+    assert [item.id for item in engine.game_state.get_location_container_items("warehouse_office", "crate")] == ["tonic"]
+
+def test_start_game_gives_copies_of_starting_items(setup_engine):
+    from game.inventory import Item, ItemCategory
+
+    engine, config = setup_engine
+    coin = Item(id="coin", name="Coin", description="Lucky.", categories={ItemCategory.TOOL}, stackable=True)
+    config.items = {"coin": coin}
+    config.game_settings.starting_inventory = ["coin", {"id": "coin"}, {"id": "missing"}]
+    engine.start_game()
+
+    (carried,) = engine.game_state.inventory_manager.items
+    assert carried is not coin
+    assert (carried.quantity, coin.quantity) == (2, 1)
+
+def test_phrase_commands_allow_trailing_words(setup_engine):
+    engine, _ = setup_engine
+    exits = engine.process_input("exits")
+    assert engine.process_input("where can i go now") == exits
+    assert engine.process_input("Where can I go from here?") == exits
+
+def test_save_name_collapses_whitespace(setup_engine, monkeypatch):
+    engine, _ = setup_engine
+    names = []
+    monkeypatch.setattr(engine, "_handle_save_command", lambda name: names.append(name) or "")
+    monkeypatch.setattr(engine, "_handle_load_command", lambda name: names.append(name) or "")
+    engine.process_input("save  My   Game ")
+    engine.process_input("load my game")
+    assert names == ["my game", "my game"]
@@ -216,4 +216,58 @@ def test_remove_from_container(inventory_manager, sample_container, sample_item)
     sample_container.contents.append(sample_item)
     removed_item = inventory_manager.remove_from_container(sample_container.id, sample_item.id)
     assert removed_item == sample_item
-    assert sample_item not in sample_container.contents 
\ No newline at end of file
+    assert sample_item not in sample_container.contents 
+
+
+def test_find_item_by_name(inventory_manager, sample_item, sample_wearable, sample_container):
+    inventory_manager.add_item(sample_item)
+    inventory_manager.add_item(sample_wearable)
+    inventory_manager.containers.append(sample_container)
+    assert inventory_manager.find_item_by_name("TEST ITEM") is sample_item
+    assert inventory_manager.find_item_by_name(sample_container.name) is sample_container
+    assert inventory_manager.find_item_by_name("missing") is None
+
+    # The index follows equip and remove
+    inventory_manager.equip_item(sample_wearable.id)
+    assert inventory_manager.find_item_by_name(sample_wearable.name) is sample_wearable
+    inventory_manager.remove_item(sample_item.id)
+    assert inventory_manager.find_item_by_name("test item") is None
+
+def test_container_current_weight(sample_container, sample_item):
+    assert sample_container.current_weight == 0
+    sample_item.quantity = 3
+    sample_container.add_item(sample_item)
+    assert sample_container.current_weight == 3.0
+    sample_container.remove_item(sample_item.id)
+    assert sample_container.current_weight == 2.0
+
+def test_find_item_prefers_exact_container_match(inventory_manager, sample_container):
+    box = Item(id="box_key", name="Test Container Key", description="A key",
+               categories={ItemCategory.TOOL})
+    inventory_manager.add_item(box)
+    inventory_manager.containers.append(sample_container)
+    assert inventory_manager.find_item_by_name("test container") is sample_container
+    assert inventory_manager.find_item_by_name("container") is box
+
+def test_container_allowed_categories(sample_container):
+    assert sample_container.is_allowed_category({ItemCategory.TOOL, ItemCategory.EVIDENCE})
+    assert not sample_container.is_allowed_category({ItemCategory.WEARABLE})
+
+def test_container_without_allowed_categories_accepts_anything(inventory_manager, sample_item):
+    basket = Container(id="basket", name="Basket", description="A wicker basket",
+                       categories={ItemCategory.CONTAINER}, capacity=10.0, allowed_categories=None)
+    inventory_manager.containers.append(basket)
+    assert basket.is_allowed_category({ItemCategory.WEARABLE})
+    assert inventory_manager.add_to_container("basket", sample_item)
+    assert basket.contents == [sample_item]
+
+def test_add_to_restricted_container(inventory_manager, sample_container, sample_item):
+    inventory_manager.containers.append(sample_container)
+    coat = Item(id="coat", name="Coat", description="A coat", categories={ItemCategory.WEARABLE})
+    assert not inventory_manager.add_to_container("test_container", coat)
+    # Every category must be allowed, unlike Container.add_item
+    torn_note = Item(id="torn_note", name="Torn Note", description="A torn note",
+                     categories={ItemCategory.TOOL, ItemCategory.EVIDENCE})
+    assert not inventory_manager.add_to_container("test_container", torn_note)
+    assert inventory_manager.add_to_container("test_container", sample_item)
+    assert sample_container.contents == [sample_item]
@@ -278,8 +278,8 @@ def test_notification_management(setup_quest_manager):
     assert len(notifications) == 2
     assert all(n.is_new for n in notifications)
     
-    # Test clearing old notifications
-    manager.clear_old_notifications(0)  # Clear all notifications
+    # Test draining notifications
+    assert manager.drain_notifications() == notifications
     assert len(manager.get_active_notifications()) == 0
 
 def test_quest_progress_tracking(setup_quest_manager):
@@ -332,4 +332,59 @@ def test_quest_validation(setup_quest_manager):
     # Test operations on quest that hasn't started
     assert not manager.is_quest_active("side_quest")
     assert not manager.is_objective_completed("side_quest", "obj1")
-    assert not manager.has_taken_branch("side_quest", "branch") 
\ No newline at end of file
+    assert not manager.has_taken_branch("side_quest", "branch") 
+
+
+def test_current_stage_follows_stage_changes(setup_quest_manager):
+    """Test that the stored current stage tracks set_active_stage."""
+    manager, game_state, _ = setup_quest_manager
+
+    manager.start_quest("main_quest")
+    assert game_state.get_current_stage("main_quest").id == "stage1"
+
+    assert manager.advance_quest("main_quest", "stage2")
+    assert game_state.get_current_stage("main_quest").id == "stage2"
+
+    game_state.set_active_stage("main_quest", "missing_stage")
+    assert game_state.get_current_stage("main_quest") is None
+
+def test_advance_to_next_stage_uses_status_enum():
+    """Test that stage transitions store QuestStatus members, not strings."""
+    from quest.quest import Quest as SimpleQuest
+
+    quest = SimpleQuest(
+        id="simple",
+        title="Simple",
+        description="A simple quest",
+        objectives=[],
+        stages=[
+            QuestStage(id="first", title="First", description="", status="InProgress"),
+            QuestStage(id="second", title="Second", description="", status=QuestStatus.NotStarted),
+        ],
+    )
+
+    assert quest.advance_to_next_stage()
+    assert quest.stages[0].status is QuestStatus.Completed
+    assert quest.get_current_stage() is quest.stages[1]
+
+def test_drain_notifications(setup_quest_manager):
+    """Test that draining returns new notifications once and empties the queue."""
+    manager, _, _ = setup_quest_manager
+
+    manager.start_quest("main_quest")
+    manager.complete_objective("main_quest", "obj1")
+
+    drained = manager.drain_notifications()
+    assert [n.type for n in drained] == [NotificationType.QuestStarted, NotificationType.ObjectiveCompleted]
+    assert manager.drain_notifications() == []
+    assert len(manager.notifications) == 0
+
+def test_quests_grouped_by_status(setup_quest_manager):
+    """Test grouping quests by status in one call."""
+    manager, game_state, _ = setup_quest_manager
+
+    manager.start_quest("main_quest")
+    by_status = game_state.get_quests_by_status()
+    assert [q.id for q in by_status[QuestStatus.InProgress]] == ["main_quest"]
+    assert [q.id for q in by_status[QuestStatus.NotStarted]] == ["side_quest"]
+    assert by_status[QuestStatus.Failed] == []
@@ -0,0 +1,27 @@
+"""Unit tests for the save manager."""
+
+import pytest
+from save.save_load import SaveManager
+
+@pytest.fixture
+def save_manager(tmp_path):
+    """Fixture for a SaveManager reading from a temporary directory."""
+    for filename in ("first-20240101-120000.save", "second-20240102-120000.save"):
+        (tmp_path / filename).write_text("{}", encoding="utf-8")
+    manager = SaveManager()
+    manager.save_dir = str(tmp_path)
+    return manager
+
+def test_list_saves_reuses_listing_until_directory_changes(save_manager, monkeypatch):
+    """Test that list_saves only re-reads save files after the directory changes."""
+    reads = []
+    original = save_manager.get_save_metadata
+    monkeypatch.setattr(save_manager, "get_save_metadata", lambda path: reads.append(path) or original(path))
+
+    assert [s.save_name for s in save_manager.list_saves()] == ["second", "first"]
+    assert [s.save_name for s in save_manager.list_saves()] == ["second", "first"]
+    assert len(reads) == 2
+
+    save_manager.delete_save("second-20240102-120000.save")
+    assert [s.save_name for s in save_manager.list_saves()] == ["first"]
+    assert len(reads) == 3
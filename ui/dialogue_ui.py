@@ -54,15 +54,18 @@ class DialogueMode:
         self.latest_responses = []
         self.previously_shown_lines = 0
         
-        # Create and run the async task to process responses
-        asyncio.create_task(self._async_process_dialogue(responses))
+        # The opening turn runs through the same path as every later turn
+        asyncio.create_task(self.advance(responses))
 
-    async def _async_process_dialogue(self, responses: List[DialogueResponse]) -> None:
-        """Process dialogue responses asynchronously."""
+    async def advance(self, responses: List[DialogueResponse]) -> None:
+        """Run a single dialogue turn for the given responses.
+
+        Both the opening turn and every option selection go through here.
+        process_responses already renders the turn (or ends the dialogue when
+        no options remain), so all that is left is to hand focus back.
+        """
         # Process the responses (will wait for any skill checks to complete)
         await self.process_responses(responses)
-        # Update the display after all responses are processed
-        self.update_display()
         # Set focus to the input box
         self.game_ui.game_input.focus()
 
@@ -322,19 +325,9 @@ class DialogueMode:
                     
                     current_line += char
                     
-                    # Create a temporary buffer with current state
-                    temp_buffer = self.current_dialogue_buffer.copy()
-                    
-                    # Add the current in-progress line
-                    if line_index + start_pos < len(temp_buffer):
-                        temp_buffer[line_index + start_pos] = current_line
-                    else:
-                        temp_buffer.append(current_line)
-                    
-                    # Clear and redisplay with updated line
-                    self.game_ui.game_output.clear()
-                    for buffer_line in temp_buffer:
-                        self.game_ui.game_output.write(buffer_line)
+                    # Update only the in-progress line; the widgets for the
+                    # rest of the buffer stay mounted
+                    self.game_ui.game_output.set_line(line_index + start_pos, current_line)
                     
                     # Adding a delay between characters for the typewriter effect
                     await asyncio.sleep(self.typewriter_speed)
@@ -63,6 +63,14 @@ class GameOutput(ScrollableContainer):
         self.mount(static)
         self.scroll_end(animate=False)  # Ensure we scroll to the new text
 
+    def set_line(self, index: int, text: str) -> None:
+        """Replace the text of an existing line in place, or append it if index is past the end."""
+        if index >= len(self.output_widgets):
+            self.write(text)
+            return
+        self.output_widgets[index].update(text)
+        self._text_lines[index] = text
+
     def clear(self) -> None:
         """Clear all output text."""
         for widget in self.output_widgets[:]:
@@ -258,19 +266,10 @@ class GameUI(App):
                 responses = self.game_engine.dialogue_handler.select_option(
                     selected_option_id, self.game_engine.game_state
                 )
-                # Create an async task to process responses since process_responses is now async
-                asyncio.create_task(self._async_process_dialogue_responses(responses))
+                # Run the next turn through the same path as the opening turn
+                asyncio.create_task(self.dialogue_mode.advance(responses))
             # Keep focus on the input box
             self.game_input.focus()
-    
-    async def _async_process_dialogue_responses(self, responses):
-        """Process dialogue responses asynchronously."""
-        # First process the responses (will wait for any skill checks to complete)
-        await self.dialogue_mode.process_responses(responses)
-        
-        # The dialogue's process_responses already updated the display as needed
-        # Keep focus on the input box
-        self.game_input.focus()
 
     def action_toggle_overlay(self) -> None:
         """Toggle the game overlay."""
@@ -228,23 +228,21 @@ class GameOverlay(ModalScreen):
                 ))
                 
                 # Current stage if any
-                current_stage_id = self.app.game_engine.game_state.get_active_stage(quest.id)
-                if current_stage_id:
-                    stage = next((s for s in quest.stages if s.id == current_stage_id), None)
-                    if stage:
-                        with Static(classes="debug-stage") as stage_container:
-                            stage_container.mount(Static(
-                                f"Current Stage: {stage.title} (ID: {stage.id}) - Status: {stage.status}"
-                            ))
-                            
-                            # Objectives
-                            for obj in stage.objectives:
-                                is_completed = self.app.game_engine.game_state.is_objective_completed(quest.id, obj.id)
-                                status = "✓" if is_completed else "○"
-                                with Static(classes="debug-objective") as obj_container:
-                                    obj_container.mount(Static(
-                                        f"{status} {obj.description} (ID: {obj.id})"
-                                    ))
+                stage = self.app.game_engine.game_state.get_current_stage(quest.id)
+                if stage:
+                    with Static(classes="debug-stage") as stage_container:
+                        stage_container.mount(Static(
+                            f"Current Stage: {stage.title} (ID: {stage.id}) - Status: {stage.status}"
+                        ))
+                        
+                        # Objectives
+                        for obj in stage.objectives:
+                            is_completed = self.app.game_engine.game_state.is_objective_completed(quest.id, obj.id)
+                            status = "✓" if is_completed else "○"
+                            with Static(classes="debug-objective") as obj_container:
+                                obj_container.mount(Static(
+                                    f"{status} {obj.description} (ID: {obj.id})"
+                                ))
         
         return debug_view
 
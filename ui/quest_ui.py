@@ -35,23 +35,20 @@ class QuestItem(Static):
             yield Label(self.quest.description)
             
             # Show current stage if any
-            current_stage_id = self.app.game_engine.game_state.quest_state.get_active_stage(self.quest.id)
-            if current_stage_id:
-                current_stage = next((stage for stage in self.quest.stages 
-                                    if stage.id == current_stage_id), None)
-                if current_stage:
-                    yield Label(f"Current Stage: {current_stage.title}")
-                    yield Label(current_stage.description)
-                    
-                    # Show objectives
-                    with Vertical():
-                        for obj in current_stage.objectives:
-                            is_completed = self.app.game_engine.game_state.quest_state.is_objective_completed(
-                                self.quest.id, obj.get('id', '')
-                            )
-                            status = "✓" if is_completed else "○"
-                            optional = "(Optional) " if obj.get('is_optional', False) else ""
-                            yield Label(f"{status} {optional}{obj.get('description', '')}")
+            current_stage = self.app.game_engine.game_state.quest_state.get_current_stage(self.quest.id)
+            if current_stage:
+                yield Label(f"Current Stage: {current_stage.title}")
+                yield Label(current_stage.description)
+
+                # Show objectives
+                with Vertical():
+                    for obj in current_stage.objectives:
+                        is_completed = self.app.game_engine.game_state.quest_state.is_objective_completed(
+                            self.quest.id, obj.get('id', '')
+                        )
+                        status = "✓" if is_completed else "○"
+                        optional = "(Optional) " if obj.get('is_optional', False) else ""
+                        yield Label(f"{status} {optional}{obj.get('description', '')}")
 
 class QuestList(Static):
     """Widget for displaying a list of quests."""
@@ -145,12 +142,7 @@ class QuestUI:
 
     def get_quest_stage_info(self, quest: Quest) -> Optional[Dict[str, Any]]:
         """Get information about the current quest stage."""
-        current_stage_id = self.game_state.get_active_stage(quest.id)
-        if not current_stage_id:
-            return None
-
-        current_stage = next((stage for stage in quest.stages 
-                            if stage.id == current_stage_id), None)
+        current_stage = self.game_state.get_current_stage(quest.id)
         if not current_stage:
             return None
 